@@ -14,14 +14,14 @@
 #        custom runtime (Node.js + Python) defined by a Dockerfile.
 #
 # HOW: - Reads input (initial sliders, bounds, precomputed objective values) from /tmp/bobyqa_input.json,
-#        written by core.js.
+#        written by core.js (or from a .npz of packed arrays when that path is passed as the first argument).
 #      - Uses Py-BOBYQA to optimize sliders, referencing precomputed objective values to avoid complex
 #        Node.js-Python callbacks.
 #      - Writes the optimized sliders to /tmp/bobyqa_output.json, read by core.js.
 #      - Uses /tmp for file I/O, as it’s the only writable directory in Google Cloud Functions.
 #
-# DEPENDENCIES: Requires Py-BOBYQA, numpy, pandas, scipy, etc., installed via:
-#               `python3 -m pip install Py-BOBYQA numpy pandas scipy python-dateutil pytz tzdata six`
+# DEPENDENCIES: Requires Py-BOBYQA, numpy, pandas, scipy, etc. (numba optional), installed via:
+#               `python3 -m pip install Py-BOBYQA numpy pandas scipy numba python-dateutil pytz tzdata six`
 #
 # REFERENCES:
 # - Vose, D. (2008). Risk Analysis: A Quantitative Guide. Wiley. (For optimization in risk analysis)
@@ -29,21 +29,102 @@
 # - Clemen, R. T., & Reilly, T. (2013). Making Hard Decisions with DecisionTools. (For robust outputs)
 # - McConnell, S. (2004). Code Complete. (For error handling and clarity)
 
+import hashlib
+import io
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
+from itertools import repeat
 import pybobyqa
+from pybobyqa.controller import EXIT_MAXFUN_WARNING, EXIT_SLOW_WARNING, EXIT_SUCCESS
 import json
+import os
 import numpy as np
 
-# WHAT: Reads input data from a JSON file written by core.js.
+# Numba compiles the table search to machine code; without it the same function runs as plain Python.
+# cache=True persists the compiled code; point it at /tmp, the only writable directory in Cloud Functions,
+# so warm instances skip the compile step.
+os.environ.setdefault('NUMBA_CACHE_DIR', '/tmp/numba_cache')
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# Largest dense objective table (in cells) build_objective_table will allocate; 4 bytes per cell as float32.
+# Six 0-100 sliders would need 101**6 cells, so wide grids fall back to the sparse node_lookup dict.
+MAX_TABLE_CELLS = 10_000_000
+
+# Default input file written by core.js; a path ending in .npz selects the binary NumPy format instead.
+INPUT_PATH = '/tmp/bobyqa_input.json'
+
+# File name prefix of the per-input result cache files in /tmp (see cache_path).
+CACHE_PREFIX = 'bobyqa_cache_'
+
+# Number of distinct trial points memoize_objective remembers per optimization run.
+OBJECTIVE_CACHE_SIZE = 4096
+
+# Result cache files kept in /tmp (which is memory-backed in Cloud Functions); write_cached_output evicts
+# the least recently used ones beyond this.
+RESULT_CACHE_MAX_FILES = 256
+
+# Safety cap on objective evaluations per local search; rhoend normally stops the search much earlier.
+MAX_FUN = 1000
+
+# Largest initial trust region radius, in slider units (Powell, 2009).
+MAX_RHOBEG = 10
+
+# Final trust region radius: half the integer slider spacing, below which every trial point rounds to the
+# same grid node and further evaluations cannot change the result.
+GRID_RHOEND = 0.5
+
+# Default number of starting points for the "bobyqa" solver (x0 plus Latin hypercube samples).
+DEFAULT_RESTARTS = 4
+
+# Py-BOBYQA exit flags whose result is a usable solution; error exits (e.g. a singular interpolation
+# matrix) can return x0 with a finite objective value, so results are filtered on the flag, not on f.
+BOBYQA_OK_FLAGS = (EXIT_SUCCESS, EXIT_SLOW_WARNING, EXIT_MAXFUN_WARNING)
+
+# Precomputed objective lookup for Py-BOBYQA worker processes, and the value scored for slider
+# combinations missing from it; both set once per process by init_bobyqa_worker.
+_worker_node_lookup = None
+_worker_missing_value = None
+
+# WHAT: Reads input data from a JSON or NumPy .npz file written by core.js.
 # WHY: core.js serializes the initial sliders, bounds, and precomputed objective values to pass to Python,
-#      as direct function calls between Node.js and Python are complex in Cloud Functions.
-# WHERE: Reads from /tmp/bobyqa_input.json, written by core.js in the BOBYQAOptimalSliderSettings function.
-# HOW: Uses Python’s json module to load the JSON file, expecting a structure with initialSliders (array),
-#      bounds (array of [lower, upper] pairs), and nodeData (precomputed objective values).
-def read_input():
+#      as direct function calls between Node.js and Python are complex in Cloud Functions. Parsing a large
+#      JSON nodeData allocates a Python object per entry, so callers can send the grid as packed arrays.
+# WHERE: Reads from /tmp/bobyqa_input.json (or the path passed on the command line), written by core.js in
+#        the BOBYQAOptimalSliderSettings function.
+# HOW: - JSON: expects initialSliders (array), bounds (array of [lower, upper] pairs), nodeData (precomputed
+#        objective values keyed by slider strings), an optional solver ("scan" or "bobyqa"), and an
+#        optional restarts count for the "bobyqa" solver.
+#      - .npz: expects x0 (n,), bounds (2, n), keys (N, n) integer slider combinations, values (N,), and
+#        optional 0-d solver and restarts entries; these are mapped onto the same dict with
+#        nodeKeys/nodeValues.
+#      - Returns the raw bytes alongside the parsed data for cache keying.
+def read_input(path=INPUT_PATH):
     try:
-        # Open and read the input JSON file from /tmp (writable in Cloud Functions)
-        with open('/tmp/bobyqa_input.json', 'r') as f:
-            return json.load(f)
+        # Open and read the input file from /tmp (writable in Cloud Functions)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if not path.endswith('.npz'):
+            return raw, json.loads(raw)
+        with np.load(io.BytesIO(raw)) as npz:
+            data = {
+                'initialSliders': npz['x0'],
+                'bounds': npz['bounds'],
+                'nodeKeys': npz['keys'],
+                'nodeValues': npz['values']
+            }
+            if 'solver' in npz.files:
+                data['solver'] = str(npz['solver'])
+            if 'restarts' in npz.files:
+                data['restarts'] = int(npz['restarts'])
+        return raw, data
     except Exception as e:
         # Log error and raise for robustness (Clemen & Reilly, 2013)
         print(f"Error reading input: {str(e)}")
@@ -63,68 +144,462 @@ def write_output(result):
         # Log error but don’t raise, as this is a cleanup step (McConnell, 2004)
         print(f"Error writing output: {str(e)}")
 
-# WHAT: Defines the objective function for Py-BOBYQA to optimize.
+# WHAT: Derives the result-cache file path for a given input.
+# WHY: Warm Cloud Functions instances often receive the same sliders, bounds, and nodeData again; keying
+#      a result cache on a content hash lets main() skip parsing the grid and optimizing entirely.
+# WHERE: Used by read_cached_output and write_cached_output.
+# HOW: Hashes the raw input bytes with BLAKE2b and names the cache file after the hex digest in /tmp.
+def cache_path(raw):
+    return f"/tmp/{CACHE_PREFIX}{hashlib.blake2b(raw, digest_size=16).hexdigest()}.json"
+
+# WHAT: Returns a previously cached optimization result for this input, if any.
+# WHY: Repeated invocations with identical inputs can reuse the earlier result at zero solver cost.
+# WHERE: Called by main() right after read_input().
+# HOW: - Loads the cache file named by cache_path; any read or parse failure is treated as a miss.
+#      - Touches the file's mtime on a hit so prune_result_cache evicts in least-recently-used order.
+def read_cached_output(raw):
+    path = cache_path(raw)
+    try:
+        with open(path, 'r') as f:
+            result = json.load(f)
+        os.utime(path)
+        return result
+    except (OSError, ValueError):
+        return None
+
+# WHAT: Deletes the least recently used result cache files beyond RESULT_CACHE_MAX_FILES.
+# WHY: Every distinct input adds a file to /tmp, which counts against the instance's memory in Cloud
+#      Functions; without a cap a long-lived warm instance would grow the cache without bound.
+# WHERE: Called by write_cached_output after each new cache file.
+# HOW: Lists the bobyqa_cache_ files in /tmp, sorts them by mtime (refreshed on every hit), and removes
+#      the oldest; files another process already removed are skipped.
+def prune_result_cache():
+    with os.scandir('/tmp') as entries:
+        files = [e for e in entries if e.name.startswith(CACHE_PREFIX) and e.name.endswith('.json')]
+    if len(files) <= RESULT_CACHE_MAX_FILES:
+        return
+    files.sort(key=lambda e: e.stat().st_mtime)
+    for entry in files[:len(files) - RESULT_CACHE_MAX_FILES]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+# WHAT: Stores a successful optimization result in the on-disk result cache.
+# WHY: Populates the cache consulted by read_cached_output on later invocations.
+# WHERE: Called by main() before writing a successful result; errors are never cached.
+# HOW: - Writes to a temporary file and renames it into place so a concurrent reader never sees a partial
+#        file.
+#      - Prunes the cache back to RESULT_CACHE_MAX_FILES afterwards.
+def write_cached_output(raw, result):
+    path = cache_path(raw)
+    try:
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump(result, f)
+        os.replace(f"{path}.tmp", path)
+        prune_result_cache()
+    except Exception as e:
+        # A failed cache write only costs a future recomputation (McConnell, 2004)
+        print(f"Error writing cache: {str(e)}")
+
+# WHAT: Returns the precomputed objective values as parallel key and value arrays.
+# WHY: Array form lets the table build and the scan run as vectorized NumPy operations. .npz input already
+#      arrives this way; JSON nodeData is converted once at load time.
+# WHERE: Called by main() right after read_input().
+# HOW: - Uses nodeKeys/nodeValues directly when present.
+#      - Otherwise joins the nodeData keys (e.g., "[50,50,50,50,50,50]") into one JSON array, parses it with
+#        a single json.loads call (parsing key by key costs far more than loading the input itself), and
+#        rounds it to the integer grid, giving keys of shape (N, n_sliders) and values of shape (N,).
+def node_arrays(data, n_sliders):
+    if 'nodeKeys' in data:
+        keys = np.asarray(data['nodeKeys'], dtype=np.int64).reshape(-1, n_sliders)
+        return keys, np.asarray(data['nodeValues'], dtype=np.float64)
+    node_data = data['nodeData']
+    keys = np.array(json.loads('[' + ','.join(node_data) + ']'), dtype=np.float64)
+    keys = np.rint(keys).astype(np.int64).reshape(len(node_data), n_sliders)
+    return keys, np.fromiter(node_data.values(), dtype=np.float64, count=len(node_data))
+
+# WHAT: Describes how slider positions are packed into a single integer lookup key.
+# WHY: Hashing one int is much cheaper than hashing a tuple element by element. With 0-100 sliders each
+#      offset needs 7 bits, so six sliders fit in 42 bits (Python ints also cover wider grids exactly).
+# WHERE: Used by build_node_lookup and solve_bobyqa_start so both sides agree on the key layout.
+# HOW: - Offsets each slider from its rounded lower bound.
+#      - Gives each slider the bit width of its range and stacks the fields, first slider highest.
+#      - Returns (lower, shifts) as tuples of Python ints.
+def slider_packing(bounds_lower, bounds_upper):
+    lower = np.rint(bounds_lower).astype(np.int64)
+    widths = [max(1, int(span).bit_length()) for span in np.rint(bounds_upper).astype(np.int64) - lower]
+    shifts = [sum(widths[i + 1:]) for i in range(len(widths))]
+    return tuple(lower.tolist()), tuple(shifts)
+
+# WHAT: Builds the dict used by the make_objective() objective from the key and value arrays.
+# WHY: Py-BOBYQA on a grid too large for a dense table needs a hashed lookup, keyed by the packed integers
+#      described by slider_packing.
+# WHERE: Called by main() only on the Py-BOBYQA path, so the scan and dense-table paths never allocate it.
+# HOW: Packs every in-bounds key row in one vectorized pass (falling back to Python ints if the layout
+#      needs more than 63 bits) and maps each packed key to its objective value.
+def build_node_lookup(keys, values, bounds_lower, bounds_upper):
+    lower, shifts = slider_packing(bounds_lower, bounds_upper)
+    mask = in_bounds_mask(keys, np.array(lower), np.rint(bounds_upper))
+    offsets = keys[mask] - np.array(lower, dtype=np.int64)
+    if shifts and shifts[0] + int(offsets.max(initial=0)).bit_length() > 63:
+        packed = [sum(o << sh for o, sh in zip(row, shifts)) for row in offsets.tolist()]
+    else:
+        packed = (offsets << np.array(shifts, dtype=np.int64)).sum(axis=1).tolist()
+    return dict(zip(packed, values[mask].tolist()))
+
+# WHAT: Flags which precomputed combinations fall inside the slider bounds.
+# WHY: Shared by build_objective_table and scan_nodes so both ignore out-of-range nodeData entries.
+# WHERE: Called with the integer lower and upper bounds.
+# HOW: Compares every key row against the bounds in one vectorized expression.
+def in_bounds_mask(keys, lower, upper):
+    return np.all((keys >= lower) & (keys <= upper), axis=1)
+
+# WHAT: Generates the objective function for Py-BOBYQA to optimize, specialized to the slider layout.
 # WHY: Py-BOBYQA requires a function to minimize (negated to maximize probability). Since the actual
 #      objective function is in JavaScript (in core.js), we use precomputed values from node_data to
-#      approximate it, avoiding real-time Node.js-Python callbacks.
-# WHERE: Called iteratively by Py-BOBYQA during optimization to evaluate slider combinations.
-# HOW: - Takes sliders (numpy array) and node_data (precomputed objective values from core.js).
-#      - Converts sliders to a string key (e.g., "[50,50,50,50,50,50]") to look up the precomputed value.
-#      - Returns the negated value (to maximize) or -inf if not found, ensuring robustness (Vose, 2008).
-def objective(sliders, node_data):
-    # Convert sliders array to string for lookup
-    sliders_str = str(sliders.tolist())
-    # Return negated objective value or -inf if not found
-    return -node_data.get(sliders_str, float('inf'))
+#      approximate it, avoiding real-time Node.js-Python callbacks. The slider count is fixed for a run
+#      (six in the deployed estimator), so the key construction is generated with one unrolled expression
+#      per slider instead of a generator loop building the tuple on every evaluation.
+# WHERE: Called once per process and slider layout (memoized) by solve_bobyqa_start; the returned
+#        function is then called iteratively by Py-BOBYQA to evaluate slider combinations.
+# HOW: - Takes the (lower, shifts) layout from slider_packing and generates source such as
+#          def objective(sliders, node_lookup, missing):
+#              s0, s1 = sliders.tolist()
+#              return -node_lookup.get(((int(round(s0)) - 0) << 7) | (int(round(s1)) - 0), missing)
+#        and compiles it with exec.
+#      - Keys are packed integers matching build_node_lookup.
+#      - Returns the negated value (to maximize), or the negated `missing` value if not found. Callers pass
+#        a finite value below every known one, so a missing combination is worse than any known point
+#        without breaking Py-BOBYQA's interpolation model the way an infinite value would (Vose, 2008).
+@lru_cache(maxsize=None)
+def make_objective(lower, shifts):
+    names = [f"s{i}" for i in range(len(lower))]
+    key = " | ".join(
+        f"((int(round({name})) - {lb}) << {shift})" for name, lb, shift in zip(names, lower, shifts)
+    )
+    source = (
+        "def objective(sliders, node_lookup, missing):\n"
+        f"    {''.join(f'{name},' for name in names)} = sliders.tolist()\n"
+        f"    return -node_lookup.get({key or 0}, missing)\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace['objective']
+
+# WHAT: Materializes the precomputed objective values as a dense N-D array indexed by slider offset.
+# WHY: Even with tuple keys, every evaluation still hashes a tuple and probes a dict. When the slider grid
+#      is small enough, a dense table turns each lookup into a single strided memory load.
+# WHERE: Called by main() after node_arrays; returns None when the grid exceeds MAX_TABLE_CELLS.
+# HOW: - Sizes each axis as upper - lower + 1 integer slider positions.
+#      - Stores float32: ample precision for ranking slider combinations, and half the memory traffic.
+#      - Fills missing combinations with +inf; the table is maximized directly, so every search masks
+#        non-finite entries out as unattainable.
+#      - Scatters the in-bounds values at their offsets from bounds_lower with one fancy-indexed assignment.
+def build_objective_table(keys, values, bounds_lower, bounds_upper):
+    lower = np.rint(bounds_lower).astype(np.int64)
+    upper = np.rint(bounds_upper).astype(np.int64)
+    shape = tuple(int(dim) for dim in upper - lower + 1)
+    if any(dim <= 0 for dim in shape) or np.prod(shape, dtype=np.float64) > MAX_TABLE_CELLS:
+        return None
+    table = np.full(shape, np.inf, dtype=np.float32)
+    mask = in_bounds_mask(keys, lower, upper)
+    table[tuple((keys[mask] - lower).T)] = values[mask]
+    return table
+
+# WHAT: In-process trust-region pattern search over the dense objective table.
+# WHY: For a table lookup the objective is nearly free, so Py-BOBYQA's pure-Python iteration and per-call
+#      callback dominate the run. Compiling the whole search loop with Numba keeps every step in machine
+#      code and reads the table directly, with no Python frame per evaluation.
+# WHERE: Used by main() instead of Py-BOBYQA for the "bobyqa" solver whenever a dense table could be built.
+# HOW: - Starts from x0 snapped to the integer grid and clipped to the bounds.
+#      - Polls +/- radius along each axis and keeps any move that raises the table value (Powell, 2009).
+#      - Halves the radius after a sweep with no improvement (the rho-ratio contraction) and stops once it
+#        drops below one grid step or maxfun evaluations are used.
+#      - Missing combinations (+inf in the table) are treated as unattainable rather than optimal.
+@njit(cache=True)
+def table_trust_region_search(x0, lower, upper, flat_table, strides, maxfun, rhobeg):
+    n = x0.shape[0]
+    x = np.empty(n, dtype=np.int64)
+    offset = 0
+    for i in range(n):
+        x[i] = min(max(int(round(x0[i])), lower[i]), upper[i])
+        offset += (x[i] - lower[i]) * strides[i]
+    best = flat_table[offset]
+    if not np.isfinite(best):
+        best = -np.inf
+    nfev = 1
+    radius = max(1, int(round(rhobeg)))
+    while radius >= 1 and nfev < maxfun:
+        improved = False
+        for i in range(n):
+            for step in (-radius, radius):
+                candidate = min(max(x[i] + step, lower[i]), upper[i])
+                if candidate == x[i] or nfev >= maxfun:
+                    continue
+                trial_offset = offset + (candidate - x[i]) * strides[i]
+                value = flat_table[trial_offset]
+                nfev += 1
+                if np.isfinite(value) and value > best:
+                    best = value
+                    offset = trial_offset
+                    x[i] = candidate
+                    improved = True
+        if not improved:
+            radius //= 2
+    return x.astype(np.float64)
+
+# WHAT: Finds the best precomputed slider combination by scanning the dense objective table.
+# WHY: nodeData only holds values on the integer slider grid, so the global optimum is simply the largest
+#      known value. A vectorized argmax finds it deterministically in one pass over the table, instead of
+#      a local solver spending up to 1000 evaluations and possibly stopping at a local optimum.
+# WHERE: Used by main() for the default "scan" solver whenever a dense table could be built.
+# HOW: Masks missing combinations (+inf) to -inf, takes np.argmax, and converts the flat index back to
+#      slider values offset by the integer lower bounds.
+def scan_objective_table(table, lower):
+    masked = np.where(np.isfinite(table), table, -np.inf)
+    best = int(np.argmax(masked))
+    if not np.isfinite(masked.flat[best]):
+        raise ValueError("nodeData has no entries within bounds")
+    return lower + np.array(np.unravel_index(best, table.shape), dtype=np.float64)
+
+# WHAT: Finds the best precomputed slider combination directly from the key and value arrays.
+# WHY: Same exhaustive search as scan_objective_table for grids too large to materialize densely; the
+#      scan is linear in the number of precomputed combinations rather than the size of the grid.
+# WHERE: Used by main() for the default "scan" solver when build_objective_table returns None.
+# HOW: Masks the keys inside [bounds_lower, bounds_upper] and returns the one with the largest value.
+def scan_nodes(keys, values, bounds_lower, bounds_upper):
+    mask = in_bounds_mask(keys, np.rint(bounds_lower), np.rint(bounds_upper))
+    if not mask.any():
+        raise ValueError("nodeData has no entries within bounds")
+    candidates = np.flatnonzero(mask)
+    return keys[candidates[np.argmax(values[candidates])]].astype(np.float64)
+
+# WHAT: Memoizes an objective function on the integer slider combination it evaluates.
+# WHY: Py-BOBYQA revisits the same grid cells while shrinking its trust region and during model-improvement
+#      steps. The objective only depends on the rounded sliders, so nearby float trial points that land on
+#      the same cell are cache hits too, where keying on the raw float bytes would almost never repeat.
+# WHERE: Wraps the objective chosen in main() before it is handed to pybobyqa.solve.
+# HOW: Keys an lru_cache (bounded by OBJECTIVE_CACHE_SIZE) on the tuple of rounded slider values, using
+#      the same round() as make_objective(), and evaluates the objective on that grid point on a miss.
+def memoize_objective(objfun):
+    @lru_cache(maxsize=OBJECTIVE_CACHE_SIZE)
+    def cached(key):
+        return objfun(np.array(key, dtype=np.float64))
+    return lambda x: cached(tuple(map(round, np.asarray(x, dtype=np.float64).tolist())))
+
+# WHAT: Generates starting points for a multi-start local search.
+# WHY: A single local search from x0 can stall in a local optimum; restarting from points spread across
+#      the bounds and keeping the best result makes the "bobyqa" solver far more robust (Vose, 2008).
+# WHERE: Called by main() for the "bobyqa" solver.
+# HOW: - Keeps x0 as the first start so a single restart reproduces the original behavior.
+#      - Fills the rest with a Latin hypercube sample over the bounds: each axis is split into equal strata
+#        and every stratum is used exactly once, in random order.
+#      - Seeds the generator so identical inputs give identical starts (and cacheable results).
+def latin_hypercube_starts(x0, bounds_lower, bounds_upper, count, seed=0):
+    rng = np.random.default_rng(seed)
+    samples = count - 1
+    strata = np.array([rng.permutation(samples) for _ in range(len(x0))], dtype=np.float64)
+    strata = strata.T.reshape(samples, len(x0))
+    unit = (strata + rng.random(strata.shape)) / max(samples, 1)
+    starts = bounds_lower + unit * (bounds_upper - bounds_lower)
+    return np.vstack([np.asarray(x0, dtype=np.float64), starts])
+
+# WHAT: Initializes a Py-BOBYQA worker process with the precomputed objective lookup.
+# WHY: The lookup is shipped to each worker once instead of with every start it solves.
+# WHERE: Passed as the ProcessPoolExecutor initializer in main(); also called directly for a single start.
+# HOW: - Stores node_lookup in the module-level _worker_node_lookup.
+#      - Sets _worker_missing_value one below the worst known value, the finite score make_objective()
+#        gives combinations missing from the lookup.
+def init_bobyqa_worker(node_lookup):
+    global _worker_node_lookup, _worker_missing_value
+    _worker_node_lookup = node_lookup
+    _worker_missing_value = min(node_lookup.values()) - 1.0
+
+# WHAT: Chooses the initial and final trust region radii for the local search.
+# WHY: A fixed rhobeg=10 is invalid for bounds narrower than 20 (Py-BOBYQA needs a gap of 2*rhobeg), and
+#      without rhoend the search keeps shrinking below the grid spacing until maxfun is exhausted.
+# WHERE: Called by solve() for both the jitted table search and Py-BOBYQA.
+# HOW: - rhobeg: MAX_RHOBEG, reduced to half the narrowest bound gap when the bounds are tighter. Sliders
+#        pinned by equal bounds are left out: they are not searched, and would otherwise force rhobeg to 0.
+#      - rhoend: GRID_RHOEND, kept below rhobeg for degenerate one-step bounds.
+def trust_region_radii(bounds_lower, bounds_upper):
+    gaps = (bounds_upper - bounds_lower)[bounds_upper > bounds_lower]
+    rhobeg = min(MAX_RHOBEG, 0.5 * float(gaps.min(initial=2 * MAX_RHOBEG)))
+    rhoend = min(GRID_RHOEND, 0.5 * rhobeg)
+    return rhobeg, rhoend
+
+# WHAT: Runs one Py-BOBYQA local search from a given start.
+# WHY: Module-level so ProcessPoolExecutor can pickle it and solve several starts in parallel.
+# WHERE: Mapped over the starts from latin_hypercube_starts by main().
+# HOW: - Memoizes the make_objective() objective for this slider layout over _worker_node_lookup.
+#      - Searches only the sliders with upper > lower; sliders with equal bounds are pinned at that value
+#        (Py-BOBYQA rejects bounds with a gap below 2*rhobeg).
+#      - maxfun: Caps evaluations at MAX_FUN for performance
+#      - rhobeg/rhoend: Trust region radii from trust_region_radii; stops once steps fall below the grid
+#      - Returns (x, f, flag, msg); x is None when Py-BOBYQA fails to produce a solution, and flag is its
+#        exit code (linear algebra and other error exits can still report a finite f at x0).
+def solve_bobyqa_start(x0, bounds_lower, bounds_upper, rhobeg, rhoend):
+    objective = make_objective(*slider_packing(bounds_lower, bounds_upper))
+    free = bounds_upper > bounds_lower
+    sliders = np.where(free, x0, bounds_lower).astype(np.float64)
+
+    def evaluate(free_sliders):
+        sliders[free] = free_sliders
+        return objective(sliders, _worker_node_lookup, _worker_missing_value)
+
+    soln = pybobyqa.solve(
+        memoize_objective(evaluate),
+        x0=sliders[free],
+        bounds=(bounds_lower[free], bounds_upper[free]),
+        maxfun=MAX_FUN,
+        rhobeg=rhobeg,
+        rhoend=rhoend
+    )
+    if soln.x is None:
+        return None, soln.f, soln.flag, soln.msg
+    sliders[free] = soln.x
+    return sliders, soln.f, soln.flag, soln.msg
+
+# WHAT: Optimizes the sliders for one parsed input.
+# WHY: Shared by the one-shot file mode (main) and the long-lived worker mode (serve), so both modes get
+#      the same caching and solver selection.
+# WHERE: Called by main() and serve() with the raw input bytes and the parsed data.
+# HOW: - Returns the cached result when the same input was optimized before.
+#      - By default scans all precomputed combinations for the global optimum.
+#      - With solver "bobyqa", searches locally from x0 and Latin hypercube restarts: in-process on the
+#        dense table when it fits, otherwise with Py-BOBYQA on node_lookup across worker processes.
+#      - Returns {"x": [slider values]}; errors propagate to the caller.
+def solve(raw, data):
+    # Reuse the result of an earlier run on identical input
+    cached = read_cached_output(raw)
+    if cached is not None:
+        return cached
+
+    # Extract initial sliders (x0) as a numpy array
+    x0 = np.array(data['initialSliders'])
+
+    # Extract bounds as numpy arrays (lower and upper bounds for each slider)
+    bounds_lower = np.array(data['bounds'][0])
+    bounds_upper = np.array(data['bounds'][1])
+
+    # Extract precomputed objective values as integer slider keys and float values
+    keys, values = node_arrays(data, len(x0))
+
+    # Prefer a dense lookup table when the slider grid is small enough; otherwise use the arrays
+    table = build_objective_table(keys, values, bounds_lower, bounds_upper)
+
+    # "scan" (default) returns the global optimum over nodeData; "bobyqa" keeps the local search
+    # from the current sliders (x0) for callers that want the nearest improvement instead
+    solver = data.get('solver', 'scan')
+    if solver not in ('scan', 'bobyqa'):
+        raise ValueError(f"Unknown solver: {solver}")
+    if solver == 'scan':
+        if table is not None:
+            x = scan_objective_table(table, np.rint(bounds_lower))
+        else:
+            x = scan_nodes(keys, values, bounds_lower, bounds_upper)
+    else:
+        # Start the local search from x0 and from Latin hypercube samples across the bounds
+        restarts = max(1, int(data.get('restarts', DEFAULT_RESTARTS)))
+        starts = latin_hypercube_starts(x0, bounds_lower, bounds_upper, restarts)
+        rhobeg, rhoend = trust_region_radii(bounds_lower, bounds_upper)
+        if table is not None:
+            # Search the table in-process with the jitted trust-region loop; each start takes
+            # microseconds, so they run serially and the best table value wins
+            # - maxfun and rhobeg match the Py-BOBYQA settings; the loop itself stops below one grid step
+            lower = np.rint(bounds_lower).astype(np.int64)
+            upper = np.rint(bounds_upper).astype(np.int64)
+            flat_table = table.ravel()
+            strides = np.array(table.strides, dtype=np.int64) // table.itemsize
+            best_value = -np.inf
+            x = None
+            for start in starts:
+                candidate = table_trust_region_search(
+                    start, lower, upper, flat_table, strides, MAX_FUN, rhobeg
+                )
+                value = table[tuple(candidate.astype(np.int64) - lower)]
+                value = value if np.isfinite(value) else -np.inf
+                if x is None or value > best_value:
+                    x, best_value = candidate, value
+        else:
+            # Run Py-BOBYQA from every start, in parallel worker processes when there are several
+            node_lookup = build_node_lookup(keys, values, bounds_lower, bounds_upper)
+            if not node_lookup:
+                raise ValueError("nodeData has no entries within bounds")
+            if len(starts) == 1:
+                init_bobyqa_worker(node_lookup)
+                results = [solve_bobyqa_start(starts[0], bounds_lower, bounds_upper, rhobeg, rhoend)]
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=min(len(starts), os.cpu_count() or 1),
+                    initializer=init_bobyqa_worker,
+                    initargs=(node_lookup,)
+                ) as executor:
+                    results = list(executor.map(
+                        solve_bobyqa_start, starts, repeat(bounds_lower), repeat(bounds_upper),
+                        repeat(rhobeg), repeat(rhoend)
+                    ))
+            # Drop starts that ended in a Py-BOBYQA error exit
+            solved = [r for r in results if r[0] is not None and r[2] in BOBYQA_OK_FLAGS]
+            if not solved:
+                raise RuntimeError(f"Py-BOBYQA failed: {results[0][3]}")
+            x = min(solved, key=lambda r: r[1])[0]
+
+    # Cache and return optimized sliders
+    result = {"x": x.tolist()}
+    write_cached_output(raw, result)
+    return result
 
 # WHAT: Main function to perform BOBYQA optimization.
-# WHY: Orchestrates the optimization process by reading input, running Py-BOBYQA, and writing output.
+# WHY: Orchestrates the optimization process by reading input, running solve(), and writing output.
 #      Handles errors to ensure robust execution in Cloud Functions.
 # WHERE: Called when the script is executed by python-shell from core.js.
-# HOW: - Reads input data (initial sliders, bounds, node_data).
-#      - Runs Py-BOBYQA with the objective function, initial sliders, and bounds.
-#      - Writes the optimized sliders or error to /tmp/bobyqa_output.json.
-def main():
+# HOW: - Reads input data (initial sliders, bounds, node_data, optional solver and restarts).
+#      - Writes the optimized sliders from solve() or the error to /tmp/bobyqa_output.json.
+def main(input_path=INPUT_PATH):
     try:
-        # Read input data from /tmp/bobyqa_input.json
-        data = read_input()
-        
-        # Extract initial sliders (x0) as a numpy array
-        x0 = np.array(data['initialSliders'])
-        
-        # Extract bounds as numpy arrays (lower and upper bounds for each slider)
-        bounds_lower = np.array(data['bounds'][0])
-        bounds_upper = np.array(data['bounds'][1])
-        
-        # Extract precomputed objective values
-        node_data = data['nodeData']
-        
-        # Run Py-BOBYQA optimization
-        # - objective: Uses precomputed values from node_data
-        # - x0: Initial slider values (e.g., [50, 50, 50, 50, 50, 50])
-        # - bounds: [lower, upper] for each slider (e.g., [[0,100], [0,100], ...])
-        # - maxfun: Limits evaluations to 1000 for performance
-        # - rhobeg: Initial trust region radius (10, per Powell, 2009)
-        # - doinit: Ensures initialization for robustness
-        soln = pybobyqa.solve(
-            lambda x: objective(x, node_data),
-            x0=x0,
-            bounds=(bounds_lower, bounds_upper),
-            maxfun=1000,
-            rhobeg=10,
-            doinit=True
-        )
+        # Read input data from /tmp/bobyqa_input.json (or the .npz/.json path given by core.js)
+        raw, data = read_input(input_path)
         
         # Write optimized sliders to output file
-        write_output({"x": soln.x.tolist()})
+        write_output(solve(raw, data))
     except Exception as e:
         # Write error to output file for core.js to handle (McConnell, 2004)
         write_output({"error": str(e)})
         print(f"Optimization failed: {str(e)}")
 
+# WHAT: Long-lived worker loop that answers optimization requests over stdin/stdout.
+# WHY: Spawning python3 per request re-imports NumPy, Py-BOBYQA and Numba every time, which can take longer
+#      than the optimization itself. core.js can instead keep one PythonShell open for the life of the
+#      container and pay the import cost once.
+# WHERE: Runs when core.js starts the script with --serve.
+# HOW: - Reads one JSON input per line (same structure as /tmp/bobyqa_input.json) from stdin.
+#      - Writes one JSON result per line ({"x": [...]} or {"error": "..."}) to stdout and flushes it.
+#      - Redirects diagnostic prints to stderr while solving so they never corrupt the response stream.
+def serve():
+    out = sys.stdout
+    for line in sys.stdin:
+        raw = line.strip().encode()
+        if not raw:
+            continue
+        with redirect_stdout(sys.stderr):
+            try:
+                result = solve(raw, json.loads(raw))
+            except Exception as e:
+                # Report the error for this request and keep serving (McConnell, 2004)
+                result = {"error": str(e)}
+                print(f"Optimization failed: {str(e)}")
+        out.write(json.dumps(result) + '\n')
+        out.flush()
+
 # WHAT: Entry point for the script.
 # WHY: Ensures the script runs only when executed directly (e.g., by python-shell), not when imported.
 # WHERE: Executed by python-shell when core.js calls PythonShell.run('bobyqa_optimizer.py').
-# HOW: Calls the main function to perform optimization.
+# HOW: Runs the stdin/stdout worker loop for --serve; otherwise calls the main function to perform
+#      optimization, using the input path from argv when provided.
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] == ['--serve']:
+        serve()
+    else:
+        main(*sys.argv[1:2])
@@ -2,7 +2,7 @@
 """
 PMC Estimator — Anthropic API Usage Monitor
 ============================================
-Reads the local api-usage.json log (written by APIClient / UsageTracker)
+Reads the local api-usage-YYYY-MM-DD.jsonl logs (written by APIClient / UsageTracker)
 and prints a comprehensive cost report.
 
 Usage:
@@ -25,7 +25,8 @@ from pathlib import Path
 
 AGENT_DIR    = Path(__file__).parent
 PROJECT_ROOT = AGENT_DIR.parent.parent
-USAGE_LOG    = PROJECT_ROOT / "system-google-sheets-addon" / "config" / "logs" / "api-usage.json"
+USAGE_LOG_DIR = PROJECT_ROOT / "system-google-sheets-addon" / "config" / "logs"
+USAGE_LOG    = USAGE_LOG_DIR / "api-usage-*.jsonl"  # one file per day
 TRACKER_FILE = AGENT_DIR / "api-tracker.md"
 ENV_FILE     = AGENT_DIR / ".env"
 
@@ -64,17 +65,21 @@ def load_api_key() -> str | None:
 # ── Log reading ────────────────────────────────────────────────────────────────
 
 def load_log() -> list:
-    """Return list of request records from api-usage.json. Empty list if missing."""
-    if not USAGE_LOG.exists():
-        return []
+    """Return list of request records from the daily api-usage logs. Empty list if missing."""
+    records = []
     try:
-        data = json.loads(USAGE_LOG.read_text(encoding="utf-8"))
-        if isinstance(data, list):
-            return data
-        # Aggregated dict — can't break down by request
-        return []
+        for path in sorted(USAGE_LOG_DIR.glob(USAGE_LOG.name)):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # partially written line
     except Exception:
         return []
+    return records
 
 
 def cost_of(record: dict) -> float:
@@ -104,32 +109,37 @@ def build_report(records: list, days: int | None = None) -> dict:
     now = datetime.now()
     cutoff = now - timedelta(days=days) if days else None
 
-    filtered = records
+    # Parse each record's date and cost once; the filter and every breakdown reuse them
+    rows = [(r, parse_date(r), cost_of(r)) for r in records]
+    filtered = rows
     if cutoff:
-        dated = [r for r in records if parse_date(r) and parse_date(r) >= cutoff]
-        filtered = dated if dated else records  # fall back to all if no timestamps
+        dated = [row for row in rows if row[1] and row[1] >= cutoff]
+        filtered = dated if dated else rows  # fall back to all if no timestamps
 
-    total_cost    = sum(cost_of(r) for r in filtered)
-    total_in      = sum(r.get("input_tokens", 0) for r in filtered)
-    total_out     = sum(r.get("output_tokens", 0) for r in filtered)
-    total_req     = len(filtered)
+    total_cost = 0.0
+    total_in   = 0
+    total_out  = 0
+    total_req  = len(filtered)
 
-    # Per-agent breakdown
+    # Per-agent and per-day breakdowns, accumulated in the same pass as the totals
     by_agent = defaultdict(lambda: {"requests": 0, "input_tokens": 0, "output_tokens": 0, "cost": 0.0})
-    for r in filtered:
+    by_day = defaultdict(lambda: {"requests": 0, "cost": 0.0})
+    for r, d, cost in filtered:
+        tok_in  = r.get("input_tokens", 0)
+        tok_out = r.get("output_tokens", 0)
+        total_cost += cost
+        total_in   += tok_in
+        total_out  += tok_out
+
         agent = r.get("agent", r.get("agent_name", r.get("source", "unknown")))
         by_agent[agent]["requests"]      += 1
-        by_agent[agent]["input_tokens"]  += r.get("input_tokens", 0)
-        by_agent[agent]["output_tokens"] += r.get("output_tokens", 0)
-        by_agent[agent]["cost"]          += cost_of(r)
+        by_agent[agent]["input_tokens"]  += tok_in
+        by_agent[agent]["output_tokens"] += tok_out
+        by_agent[agent]["cost"]          += cost
 
-    # Per-day breakdown
-    by_day = defaultdict(lambda: {"requests": 0, "cost": 0.0})
-    for r in filtered:
-        d = parse_date(r)
         day_key = d.strftime("%Y-%m-%d") if d else "unknown"
         by_day[day_key]["requests"] += 1
-        by_day[day_key]["cost"]     += cost_of(r)
+        by_day[day_key]["cost"]     += cost
 
     # Monthly projection (based on daily average over available days)
     if by_day and "unknown" not in list(by_day.keys())[:1]:
@@ -173,8 +183,8 @@ def print_report(report: dict, api_key: str | None):
         print(f"\n  API Key : {C.WARN}not found{C.RESET}  — set ANTHROPIC_API_KEY or add to .env")
 
     # Log source
-    if USAGE_LOG.exists():
-        print(f"  Log file: {USAGE_LOG.relative_to(PROJECT_ROOT)}")
+    if any(USAGE_LOG_DIR.glob(USAGE_LOG.name)):
+        print(f"  Log files: {USAGE_LOG.relative_to(PROJECT_ROOT)}")
         print(f"  Records : {report['record_count']} total", end="")
         if report["days_filter"]:
             print(f"  ({report['filtered_count']} in last {report['days_filter']} days)", end="")
@@ -268,7 +278,7 @@ def update_tracker(report: dict):
 ## Notes
 - Model: claude-opus-4-6
 - Pricing: $15.00/MTok input · $75.00/MTok output
-- Log: `system-google-sheets-addon/config/logs/api-usage.json`
+- Log: `system-google-sheets-addon/config/logs/api-usage-YYYY-MM-DD.jsonl`
 - Console: https://platform.claude.com/usage#rate-limit-usage
 
 ## History (last 10 checks)
@@ -8,8 +8,12 @@ All API keys, cost tracking, and usage monitoring configured centrally.
 """
 
 import sys
+import io
+import asyncio
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Add system-google-sheets-addon to path (config_api symlinks to config-api for importability)
@@ -29,8 +33,9 @@ class Colors:
     CYAN = "\033[96m"
 
 
+@lru_cache(maxsize=8)
 def load_rules(agent_dir):
-    """Load RULES.md and IMPROVEMENTS.md"""
+    """Load RULES.md and IMPROVEMENTS.md (cached per agent_dir for repeated audits)"""
     rules_file = agent_dir / "RULES.md"
     improvements_file = agent_dir / "IMPROVEMENTS.md"
 
@@ -40,35 +45,48 @@ def load_rules(agent_dir):
     return rules_content, improvements_content
 
 
+@lru_cache(maxsize=8)
 def load_math_agent_config(agent_dir):
-    """Load math-agent specific config.json"""
+    """Load math-agent specific config.json (cached per agent_dir; treat the result as read-only)"""
     config_file = agent_dir / "config.json"
     if config_file.exists():
         return json.loads(config_file.read_text())
     return {}
 
 
-def read_code_files(file_paths):
-    """Read multiple code files"""
-    code_content = {}
-    for file_path in file_paths:
-        path = Path(file_path)
-        if path.exists():
-            try:
-                code_content[str(file_path)] = path.read_text()
-            except Exception as e:
-                code_content[str(file_path)] = f"[ERROR reading file: {e}]"
-        else:
-            code_content[str(file_path)] = f"[FILE NOT FOUND: {file_path}]"
-    return code_content
+def read_code_file(file_path):
+    """Read one code file, returning an error marker instead of raising"""
+    path = Path(file_path)
+    if path.exists():
+        try:
+            return path.read_text()
+        except Exception as e:
+            return f"[ERROR reading file: {e}]"
+    return f"[FILE NOT FOUND: {file_path}]"
+
+
+def read_code_files(file_paths, max_workers=16):
+    """Read multiple code files concurrently (I/O-bound, so threads overlap the disk waits)"""
+    file_paths = list(file_paths)
+    if not file_paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        contents = executor.map(read_code_file, file_paths)
+        return {str(file_path): content for file_path, content in zip(file_paths, contents)}
 
 
 def build_audit_prompt(rules, improvements, code_files, config):
     """Build the prompt for the mathematician auditor"""
 
-    code_section = "\n".join(
-        [f"## File: {name}\n```\n{content[:8000]}\n```\n" for name, content in code_files.items()]
-    )
+    # Stream each (truncated) file into one buffer instead of building a list of copies to join
+    buf = io.StringIO()
+    for i, (name, content) in enumerate(code_files.items()):
+        if i:
+            buf.write("\n")
+        buf.write(f"## File: {name}\n```\n")
+        buf.write(content[:8000])
+        buf.write("\n```\n")
+    code_section = buf.getvalue()
 
     prompt = f"""You are a Nobel Prize-winning mathematician specializing in probability theory and statistics, serving as a rigorous quality assurance auditor for a probabilistic estimation system.
 
@@ -132,8 +150,13 @@ def prompt_provider_selection(available_providers):
             print("Please enter a number.")
 
 
-def audit_files(file_paths, agent_dir=None, preferred_provider=None, interactive=False):
-    """Main audit function with provider selection"""
+def audit_files(file_paths, agent_dir=None, preferred_provider=None, interactive=False, per_file=False):
+    """Main audit function with provider selection
+
+    With per_file=True each file is audited in its own request and the requests
+    run concurrently, so wall time tracks the largest file rather than the sum.
+    The default single prompt is kept for cross-file integration checks.
+    """
 
     if agent_dir is None:
         agent_dir = Path(__file__).parent
@@ -167,8 +190,14 @@ def audit_files(file_paths, agent_dir=None, preferred_provider=None, interactive
         else:
             print(Colors.CRITICAL + f"✗ {name}" + Colors.RESET)
 
-    # Build prompt
-    prompt = build_audit_prompt(rules, improvements, code_files, math_agent_config)
+    # Build prompt(s): one per file in per-file mode, otherwise one covering every file
+    if per_file and len(code_files) > 1:
+        prompts = [
+            (name, build_audit_prompt(rules, improvements, {name: content}, math_agent_config))
+            for name, content in code_files.items()
+        ]
+    else:
+        prompts = [(None, build_audit_prompt(rules, improvements, code_files, math_agent_config))]
 
     # Initialize unified API client
     print(Colors.BOLD + "\nInitializing API Client" + Colors.RESET)
@@ -202,16 +231,32 @@ def audit_files(file_paths, agent_dir=None, preferred_provider=None, interactive
         print(Colors.CRITICAL + f"ERROR initializing API client: {e}" + Colors.RESET)
         sys.exit(1)
 
-    # Make API call
+    # Make API call(s)
     print(Colors.BOLD + "\nInvoking LLM for Mathematical Audit..." + Colors.RESET)
+    if len(prompts) > 1:
+        print(f"Auditing {len(prompts)} files in parallel")
+
+    requests = [
+        {
+            "messages": [{"role": "user", "content": prompt}],
+            "system_prompt": "You are a Nobel Prize-winning mathematician specializing in probability theory.",
+        }
+        for _, prompt in prompts
+    ]
 
     try:
-        response = client.call(
-            messages=[{"role": "user", "content": prompt}],
-            system_prompt="You are a Nobel Prize-winning mathematician specializing in probability theory.",
-        )
+        if len(requests) == 1:
+            responses = [client.call(**requests[0])]
+        else:
+            # Per-file requests run concurrently on one event loop
+            responses = asyncio.run(client.acall_many(requests))
 
-        audit_result = response.content
+        if len(responses) == 1:
+            audit_result = responses[0].content
+        else:
+            audit_result = "\n\n".join(
+                f"## Audit: {name}\n\n{response.content}" for (name, _), response in zip(prompts, responses)
+            )
 
         # Output results
         print(
@@ -227,10 +272,14 @@ def audit_files(file_paths, agent_dir=None, preferred_provider=None, interactive
         print(audit_result)
         print(Colors.BOLD + "=" * 80 + Colors.RESET)
 
-        # Display usage
-        print(Colors.CYAN + f"\nProvided by: {response.provider}" + Colors.RESET)
-        print(f"Tokens: {response.input_tokens} in + {response.output_tokens} out")
-        print(f"Cost: ${response.cost_usd:.4f}")
+        # Display usage (summed across requests)
+        providers = ", ".join(dict.fromkeys(response.provider for response in responses))
+        print(Colors.CYAN + f"\nProvided by: {providers}" + Colors.RESET)
+        print(
+            f"Tokens: {sum(r.input_tokens for r in responses)} in + "
+            f"{sum(r.output_tokens for r in responses)} out"
+        )
+        print(f"Cost: ${sum(r.cost_usd for r in responses):.4f}")
 
         return audit_result
 
@@ -267,13 +316,19 @@ def main():
         help="Prompt user to select provider interactively",
     )
 
+    parser.add_argument(
+        "--per-file",
+        action="store_true",
+        help="Audit each file in its own concurrent request instead of one combined prompt",
+    )
+
     args = parser.parse_args()
 
     # Resolve file paths relative to project root
     project_root = Path(__file__).parent.parent.parent
     resolved_files = [str(project_root / f) for f in args.files]
 
-    audit_files(resolved_files, args.agent_dir, args.provider, args.interactive)
+    audit_files(resolved_files, args.agent_dir, args.provider, args.interactive, args.per_file)
 
 
 if __name__ == "__main__":
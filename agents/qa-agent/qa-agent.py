@@ -54,10 +54,10 @@ _EST_OUT_TOKENS = {
 # Overhead tokens added to each call (system prompt, framing, etc.)
 _CALL_OVERHEAD_TOKENS = 2_500
 
-# Path to the API usage log written by UsageTracker / APIClient
-_USAGE_LOG = (
+# Directory of the daily API usage logs (api-usage-YYYY-MM-DD.jsonl) written by UsageTracker / APIClient
+_USAGE_LOG_DIR = (
     Path(__file__).parent.parent.parent
-    / "system-google-sheets-addon" / "config" / "logs" / "api-usage.json"
+    / "system-google-sheets-addon" / "config" / "logs"
 )
 
 AGENT_DIR  = Path(__file__).parent
@@ -402,36 +402,37 @@ def read_current_usage() -> dict:
     """
     blank = {"total_cost": 0.0, "total_input_tokens": 0, "total_output_tokens": 0,
              "total_requests": 0}
-    if not _USAGE_LOG.exists():
+    if not _USAGE_LOG_DIR.exists():
         return blank
     try:
-        data = json.loads(_USAGE_LOG.read_text(encoding="utf-8"))
-        if not data:
-            return blank
-        # The log is a list of request records
-        if isinstance(data, list):
-            total_cost = sum(r.get("cost_usd", 0.0) for r in data)
-            total_in   = sum(r.get("input_tokens", 0)  for r in data)
-            total_out  = sum(r.get("output_tokens", 0) for r in data)
-            return {
-                "total_cost":          total_cost,
-                "total_input_tokens":  total_in,
-                "total_output_tokens": total_out,
-                "total_requests":      len(data),
-            }
-        # Already aggregated dict
-        if isinstance(data, dict):
-            return {
-                "total_cost":          data.get("total_cost_usd", data.get("total_cost", 0.0)),
-                "total_input_tokens":  data.get("total_input_tokens", 0),
-                "total_output_tokens": data.get("total_output_tokens", 0),
-                "total_requests":      data.get("total_requests", 0),
-            }
+        usage = dict(blank)
+        for r in _iter_usage_records():
+            usage["total_cost"]          += r.get("cost_usd", 0.0)
+            usage["total_input_tokens"]  += r.get("input_tokens", 0)
+            usage["total_output_tokens"] += r.get("output_tokens", 0)
+            usage["total_requests"]      += 1
+        return usage
     except Exception:
         pass
     return blank
 
 
+def _iter_usage_records():
+    """
+    Yield request records from the daily usage logs one at a time, so totals
+    are summed without loading the whole history into memory.
+    """
+    # The logs are JSON Lines: one request record per line, one file per day
+    for path in sorted(_USAGE_LOG_DIR.glob("api-usage-*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+
 def estimate_phase_costs(args, manifest: dict) -> list:
     """
     Returns a list of dicts:
@@ -15,9 +15,13 @@ Usage:
 """
 
 import argparse
+import io
 import json
+import mmap
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import anthropic
@@ -28,17 +32,30 @@ PROJECT_ROOT = AGENT_DIR.parent.parent
 
 
 def load_file(path: Path) -> str:
-    """Read a source file and return its content with line numbers."""
+    """Read a source file and return its content with line numbers.
+
+    Lines are streamed from an mmap and numbered into a single buffer, so large
+    files are not held as a full string plus split and numbered line lists.
+    """
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-        numbered = [f"{i+1:4d}: {line}" for i, line in enumerate(lines)]
-        return "\n".join(numbered)
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                buf = io.StringIO()
+                for i, line in enumerate(iter(mm.readline, b""), 1):
+                    if i > 1:
+                        buf.write("\n")
+                    buf.write(f"{i:4d}: ")
+                    buf.write(line.rstrip(b"\r\n").decode("utf-8"))
+                return buf.getvalue()
     except FileNotFoundError:
         return f"[ERROR: file not found at {path}]"
     except Exception as e:
         return f"[ERROR reading {path}: {e}]"
 
 
+@lru_cache(maxsize=None)
 def load_rules() -> str:
     rules_path = AGENT_DIR / "RULES.md"
     if rules_path.exists():
@@ -46,6 +63,7 @@ def load_rules() -> str:
     return ""
 
 
+@lru_cache(maxsize=None)
 def load_config() -> dict:
     config_path = AGENT_DIR / "config.json"
     if config_path.exists():
@@ -127,12 +145,11 @@ def main():
         print("ERROR: Provide --question or --template.", file=sys.stderr)
         sys.exit(1)
 
-    # Load source files
-    loaded_files = []
-    for rel_path in args.files:
-        full_path = PROJECT_ROOT / rel_path
-        content = load_file(full_path)
-        loaded_files.append((rel_path, content))
+    # Load source files (concurrently; reads are I/O-bound)
+    with ThreadPoolExecutor(max_workers=min(16, len(args.files))) as executor:
+        contents = list(executor.map(load_file, [PROJECT_ROOT / rel_path for rel_path in args.files]))
+    loaded_files = list(zip(args.files, contents))
+    for rel_path, content in loaded_files:
         print(f"  Loaded: {rel_path} ({len(content.splitlines())} lines)", file=sys.stderr)
 
     rules = load_rules()
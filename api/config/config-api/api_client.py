@@ -4,19 +4,88 @@ Provides a single interface for all agents to use any LLM provider.
 
 Handles:
 - Provider selection (config default or CLI override)
-- Fallback providers
-- Usage tracking & cost control
-- Rate limiting
-- Retry logic with exponential backoff
+- Fallback providers, ordered by recent provider health
+- Usage tracking & cost control (background log writes, cached limit checks)
+- Rate limiting (daily quotas and per-provider token buckets)
+- Retry logic with capped, jittered backoff
+- Response caching for identical requests
+- Async calls (acall / acall_many) for concurrent requests from one event loop
+- Batched calls (call_batch) packing many small requests into one
 """
 
+import asyncio
 import json
+import logging
+import random
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+from .base_provider import APIResponse
 from .providers.provider_factory import ProviderFactory
 from .usage_tracker import UsageTracker
+from .usage_logger import UsageLogger
 from .credentials import CredentialsManager
+from .response_cache import ResponseCache
+from .rate_limiter import TokenBucket
+from .provider_health import ProviderHealth
+
+logger = logging.getLogger(__name__)
+
+# Default seconds an identical request is answered from the response cache
+DEFAULT_CACHE_TTL_SECONDS = 300
+
+# Default client-side request rate per provider and agent (override with "rps"/"burst")
+DEFAULT_PROVIDER_RPS = 10
+
+# Seconds a provider is tried last after it fails (override with api.provider_cooldown_seconds)
+DEFAULT_PROVIDER_COOLDOWN_SECONDS = 30
+
+# Retry backoff step (seconds) and per-retry cap (ms); the step must be well under the cap,
+# or every retry waits the cap (override with api.retry_backoff_base / api.retry_backoff_cap_ms)
+DEFAULT_RETRY_BACKOFF_BASE = 0.1
+DEFAULT_RETRY_BACKOFF_CAP_MS = 500
+
+# System prompt for call_batch(strategy="inline"): one JSON reply covering every task
+INLINE_BATCH_PROMPT = (
+    "You will receive a JSON object with a list of independent tasks. Answer each task "
+    "on its own, as if it were a separate conversation. Respond with only a JSON array "
+    'with one object per task: {"id": <task id>, "content": "<your answer>"}.'
+)
+
+# Usage log entries written per batch, and max seconds an entry waits to be written
+# (override with usage_control.flush_every / usage_control.flush_interval_seconds)
+DEFAULT_LOG_FLUSH_EVERY = 64
+DEFAULT_LOG_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Seconds the on-disk request count / monthly cost used by limit checks is reused
+LIMIT_CHECK_TTL_SECONDS = 5
+
+# HTTP statuses that will fail the same way on retry (bad request, auth, permission, not found)
+_NON_RETRYABLE_STATUS = frozenset({400, 401, 403, 404, 422})
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Return the Retry-After delay (seconds) from a provider HTTP error, if any"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=8)
+def _load_config(path: str) -> dict:
+    """
+    Load and parse agency-config.json once per resolved path.
+
+    Every APIClient for the same config shares the returned dict, so treat it
+    as read-only.
+    """
+    return json.loads(Path(path).read_text())
 
 
 class APIClient:
@@ -32,6 +101,16 @@ class APIClient:
         print(f"Used {response.provider}, cost: ${response.cost_usd}")
     """
 
+    # Shared by all clients in the process; keys include the agent name
+    _response_cache = ResponseCache(maxsize=1000)
+
+    # Token buckets by (provider, agent), shared by all clients in the process
+    _buckets = {}
+    _buckets_lock = threading.Lock()
+
+    # Health by provider name, shared by all clients in the process
+    _health = {}
+
     def __init__(
         self,
         agent_name: str,
@@ -58,8 +137,7 @@ class APIClient:
         if not config_path.exists():
             raise FileNotFoundError(f"Config not found: {config_path}")
 
-        with open(config_path) as f:
-            self.config = json.load(f)
+        self.config = _load_config(str(config_path.resolve()))
 
         # Initialize managers
         self.credentials = CredentialsManager(self.config)
@@ -72,110 +150,539 @@ class APIClient:
 
         self.agent_config = self.config["agents"][agent_name]
 
+        # Providers to try in configured order (primary, then fallbacks), lowercased;
+        # built once, so set preferred_provider via the constructor
+        primary = preferred_provider or self.agent_config.get("provider", "claude")
+        self._providers_to_try = tuple(
+            name.lower() for name in (primary, *self.agent_config.get("fallback_providers", []))
+        )
+        self._provider_healths = tuple(
+            self._health.setdefault(name, ProviderHealth()) for name in self._providers_to_try
+        )
+
+        # Provider instances by name, created on first use (see _get_provider)
+        self._providers = {}
+        # Providers enabled in config, computed once (the shared config is read-only)
+        self._enabled = frozenset(
+            name.lower() for name, provider_config in self.config.get("providers", {}).items()
+            if provider_config.get("enabled")
+        )
+
+        # Usage log entries are written in batches by a background thread (drained at exit),
+        # shared by every client logging to the same file
+        usage_control = self.config.get("usage_control", {})
+        self._usage_logger = UsageLogger.shared(
+            self.usage_tracker,
+            batch_size=usage_control.get("flush_every", DEFAULT_LOG_FLUSH_EVERY),
+            flush_interval=usage_control.get("flush_interval_seconds", DEFAULT_LOG_FLUSH_INTERVAL_SECONDS),
+        )
+        self._usage_lock = threading.Lock()
+
+        # Limit checks: (expires_at, requests_today, cost) read from the tracker,
+        # plus requests and cost recorded by this client since then, plus requests
+        # that passed the check and haven't finished (so concurrent calls can't all pass)
+        self._limit_snapshot = None
+        self._requests_since_snapshot = 0
+        self._cost_since_snapshot = 0.0
+        self._requests_in_flight = 0
+
     def call(
         self,
         messages: list,
         system_prompt: Optional[str] = None,
         max_tokens: Optional[int] = None,
+        use_cache: bool = True,
     ):
         """
         Make API call with automatic provider selection, retries, and tracking.
 
+        Identical requests within the agent's cache_ttl (default 300s, 0 disables)
+        return the earlier response without a provider call or usage log entry.
+
         Args:
             messages: List of messages [{"role": "user", "content": "..."}]
             system_prompt: Optional system message
             max_tokens: Optional max tokens in response
+            use_cache: Set False to always call the provider
 
         Returns:
             APIResponse object with content, provider, cost, tokens, etc.
 
         Raises:
-            ValueError: If rate limit exceeded or cost limit reached
+            ValueError: If rate limit exceeded or cost limit reached, or if the
+                last provider tried is not in config, not enabled or has no API key
             Exception: If all providers fail
         """
-        # Check rate limits
-        within_daily_limit, requests_today, limit = self.usage_tracker.check_requests_per_agent_per_day(
-            self.agent_name
+        cache_ttl, cache_key = self._cache_lookup_key(
+            self._providers_to_try[0], messages, system_prompt, max_tokens, use_cache
         )
-        if not within_daily_limit:
-            raise ValueError(
-                f"Daily request limit exceeded for {self.agent_name} "
-                f"({requests_today}/{limit} requests today)"
-            )
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        self._check_limits()
+        try:
+            return self._call_providers(messages, system_prompt, max_tokens, cache_key, cache_ttl)
+        finally:
+            self._release_request()
+
+    def _call_providers(self, messages, system_prompt, max_tokens, cache_key, cache_ttl):
+        """call() after the limit check: try providers healthiest first, with retries"""
+        providers_to_try = self._rank_providers()
+        for provider_name in providers_to_try:
+            try:
+                provider = self._get_provider(provider_name)
+                started = time.monotonic()
 
-        # Check cost limits
-        within_cost_limit, cost, limit = self.usage_tracker.check_cost_limit()
-        if not within_cost_limit:
-            raise ValueError(
-                f"Monthly cost limit exceeded (${cost:.2f}/${limit}). "
-                f"Increase hard_limit_dollars in agency-config.json"
-            )
+                # Make call with retries
+                response = self._call_with_retries(
+                    provider, messages, system_prompt, max_tokens, bucket=self._get_bucket(provider_name)
+                )
 
-        # Determine which providers to try
-        primary = self.preferred_provider or self.agent_config.get("provider", "claude")
-        fallbacks = self.agent_config.get("fallback_providers", [])
-        providers_to_try = [primary] + fallbacks
+                self._record_success(
+                    provider_name, response, max_tokens, cache_key, cache_ttl, time.monotonic() - started
+                )
+                return response
+
+            except ValueError as e:
+                # Provider can't be used (not in config, not enabled, no API key) - no point
+                # retrying it, but a healthier-ranked fallback failing this way mustn't stop
+                # the others from being tried
+                if provider_name == providers_to_try[-1]:
+                    raise
+                logger.warning("Provider %s unavailable: %s. Trying fallback...", provider_name, e)
 
-        last_error = None
+            except Exception as e:
+                self._handle_provider_failure(provider_name, providers_to_try, e)
 
-        for provider_name in providers_to_try:
-            try:
-                # Get provider config
-                if provider_name not in self.config.get("providers", {}):
-                    raise ValueError(f"Provider '{provider_name}' not in config")
+    async def acall(
+        self,
+        messages: list,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        use_cache: bool = True,
+    ):
+        """
+        Async version of call() for running many requests from one event loop.
+
+        Same provider selection, fallback, caching, limits and usage tracking as
+        call(), but awaits the provider's async SDK client and sleeps between
+        retries with asyncio.sleep, so other requests proceed during network
+        waits and backoff.
 
-                provider_config = self.config["providers"][provider_name]
+        Args:
+            messages: List of messages [{"role": "user", "content": "..."}]
+            system_prompt: Optional system message
+            max_tokens: Optional max tokens in response
+            use_cache: Set False to always call the provider
 
-                # Get API key
-                api_key = self.credentials.get(provider_name)
+        Returns:
+            APIResponse object with content, provider, cost, tokens, etc.
 
-                # Create provider
-                provider = ProviderFactory.create(provider_name, provider_config, api_key)
+        Raises:
+            ValueError: If rate limit exceeded or cost limit reached, or if the
+                last provider tried is not in config, not enabled or has no API key
+            Exception: If all providers fail
+        """
+        cache_ttl, cache_key = self._cache_lookup_key(
+            self._providers_to_try[0], messages, system_prompt, max_tokens, use_cache
+        )
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Off the event loop: the check may wait for queued usage log writes
+        await asyncio.to_thread(self._check_limits)
+        try:
+            return await self._acall_providers(messages, system_prompt, max_tokens, cache_key, cache_ttl)
+        finally:
+            self._release_request()
+
+    async def _acall_providers(self, messages, system_prompt, max_tokens, cache_key, cache_ttl):
+        """acall() after the limit check: try providers healthiest first, with retries"""
+        providers_to_try = self._rank_providers()
+        for provider_name in providers_to_try:
+            try:
+                provider = self._get_provider(provider_name)
+                started = time.monotonic()
 
                 # Make call with retries
-                response = self._call_with_retries(provider, messages, system_prompt, max_tokens)
-
-                # Log usage
-                self.usage_tracker.log_request(
-                    agent_name=self.agent_name,
-                    provider=provider_name,
-                    tokens_in=response.input_tokens,
-                    tokens_out=response.output_tokens,
-                    cost=response.cost_usd,
-                    status="success",
-                    metadata={"max_tokens": max_tokens},
+                response = await self._acall_with_retries(
+                    provider, messages, system_prompt, max_tokens, bucket=self._get_bucket(provider_name)
                 )
 
+                self._record_success(
+                    provider_name, response, max_tokens, cache_key, cache_ttl, time.monotonic() - started
+                )
                 return response
 
             except ValueError as e:
-                # Rate limit or cost error - don't retry
-                raise e
+                # Provider can't be used (not in config, not enabled, no API key) - no point
+                # retrying it, but a healthier-ranked fallback failing this way mustn't stop
+                # the others from being tried
+                if provider_name == providers_to_try[-1]:
+                    raise
+                logger.warning("Provider %s unavailable: %s. Trying fallback...", provider_name, e)
 
             except Exception as e:
-                last_error = e
-                provider_name_display = provider_name
+                self._handle_provider_failure(provider_name, providers_to_try, e)
 
-                if provider_name == providers_to_try[-1]:
-                    # Last provider failed
-                    self.usage_tracker.log_request(
-                        agent_name=self.agent_name,
-                        provider=provider_name,
-                        tokens_in=0,
-                        tokens_out=0,
-                        cost=0,
-                        status="failure",
-                        metadata={"error": str(e)},
-                    )
-                    raise Exception(f"All providers failed. Last error: {e}") from e
-                else:
-                    # Try next provider
-                    print(f"Provider {provider_name} failed: {e}. Trying fallback...")
-                    continue
-
-    def _call_with_retries(self, provider, messages, system_prompt, max_tokens, max_attempts=3):
-        """
-        Call provider with exponential backoff retry.
+    async def acall_many(self, requests: list) -> list:
+        """
+        Run several requests concurrently and return their responses in order.
+
+        Example:
+            responses = asyncio.run(client.acall_many([
+                {"messages": [{"role": "user", "content": "..."}]},
+                {"messages": [{"role": "user", "content": "..."}], "max_tokens": 1024},
+            ]))
+
+        Args:
+            requests: List of keyword-argument dicts for acall()
+
+        Returns:
+            List of APIResponse objects, one per request
+
+        Raises:
+            Exception: The first error raised by any request
+        """
+        return await asyncio.gather(*(self.acall(**request) for request in requests))
+
+    def call_batch(
+        self,
+        requests: list,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        strategy: str = "inline",
+    ) -> list:
+        """
+        Answer several independent requests with a single provider request.
+
+        Strategies:
+            "inline": pack all requests into one message and split the model's
+                JSON reply; goes through call(), so caching, limits, fallback and
+                usage logging (one entry) apply. Token counts and cost of the
+                combined call are divided evenly across the responses.
+            "batch_api": submit to the primary provider's batch API (ChatGPT:
+                OpenAI Batch API, half price, may take up to 24h). Blocks until
+                the batch completes; logged as one usage entry.
+
+        Args:
+            requests: List of {"messages": [...], "system_prompt": optional}
+            system_prompt: System message shared by all requests
+            max_tokens: Max tokens (whole reply for inline, per request for batch_api)
+            strategy: "inline" or "batch_api"
+
+        Returns:
+            List of APIResponse objects, one per request
+
+        Raises:
+            ValueError: If strategy is unknown or unsupported by the provider,
+                limits are exceeded, or the inline reply can't be split
+            Exception: If the provider call fails
+        """
+        if not requests:
+            return []
+        if strategy == "inline":
+            return self._call_batch_inline(requests, system_prompt, max_tokens)
+        if strategy == "batch_api":
+            return self._call_batch_api(requests, system_prompt, max_tokens)
+        raise ValueError(f"Unknown batch strategy: '{strategy}'. Use 'inline' or 'batch_api'")
+
+    def _call_batch_inline(self, requests, system_prompt, max_tokens) -> list:
+        """call_batch(strategy="inline"): one call() whose JSON reply is split per request"""
+        tasks = [
+            {"id": i, "system_prompt": request.get("system_prompt"), "messages": request["messages"]}
+            for i, request in enumerate(requests)
+        ]
+        batch_prompt = f"{system_prompt}\n\n{INLINE_BATCH_PROMPT}" if system_prompt else INLINE_BATCH_PROMPT
+        response = self.call(
+            messages=[{"role": "user", "content": json.dumps({"tasks": tasks})}],
+            system_prompt=batch_prompt,
+            max_tokens=max_tokens,
+        )
+
+        # Tolerate a fenced code block or prose around the JSON array
+        text = response.content
+        try:
+            answers = json.loads(text[text.index("["):text.rindex("]") + 1])
+            contents = {int(answer["id"]): answer["content"] for answer in answers}
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"Inline batch reply is not a JSON array of {{id, content}}: {e}") from e
+        missing = [i for i in range(len(requests)) if i not in contents]
+        if missing:
+            raise ValueError(f"Inline batch reply is missing task ids: {missing}")
+
+        n = len(requests)
+        return [
+            APIResponse(
+                content=contents[i],
+                model=response.model,
+                input_tokens=response.input_tokens // n + (i < response.input_tokens % n),
+                output_tokens=response.output_tokens // n + (i < response.output_tokens % n),
+                cost_usd=round(response.cost_usd / n, 6),
+                provider=response.provider,
+            )
+            for i in range(n)
+        ]
+
+    def _call_batch_api(self, requests, system_prompt, max_tokens) -> list:
+        """call_batch(strategy="batch_api"): submit to the primary provider's batch API"""
+        provider_name = self._providers_to_try[0]
+        provider = self._get_provider(provider_name)
+        if not hasattr(provider, "call_batch"):
+            raise ValueError(f"Provider '{provider_name}' has no batch API; use strategy='inline'")
+
+        self._check_limits()
+        try:
+            wait = self._get_bucket(provider_name).acquire(1)
+            if wait:
+                time.sleep(wait)
+            responses = provider.call_batch(requests, system_prompt, max_tokens)
+        except Exception as e:
+            self._log_usage(
+                agent_name=self.agent_name,
+                provider=provider_name,
+                tokens_in=0,
+                tokens_out=0,
+                cost=0,
+                status="failure",
+                metadata={"error": str(e), "batch_size": len(requests)},
+            )
+            raise
+        finally:
+            self._release_request()
+
+        self._log_usage(
+            agent_name=self.agent_name,
+            provider=provider_name,
+            tokens_in=sum(r.input_tokens for r in responses),
+            tokens_out=sum(r.output_tokens for r in responses),
+            cost=sum(r.cost_usd for r in responses),
+            status="success",
+            metadata={"max_tokens": max_tokens, "batch_size": len(requests)},
+        )
+        return responses
+
+    def _rank_providers(self) -> tuple:
+        """
+        Order providers healthiest first, moving any in failure cooldown to the end.
+
+        Scores are compared to one decimal and ties keep the configured order
+        (primary, then fallbacks). While every provider is out of cooldown and
+        scores above 0.95 (so all round to 1.0 and the sort would be a no-op),
+        this returns the configured tuple itself, without sorting. The EWMA
+        score never climbs back to exactly 1.0 after a failure, so the check
+        can't be for a perfect score.
+        """
+        healths = self._provider_healths
+        # Stored scores only rise toward 1.0 with recovery, so they bound current_score() from below
+        if all(health.score > 0.95 and not health.in_cooldown() for health in healths):
+            return self._providers_to_try
+
+        def rank(index):
+            health = healths[index]
+            return (health.in_cooldown(), -round(health.current_score(), 1))
+
+        return tuple(self._providers_to_try[i] for i in sorted(range(len(healths)), key=rank))
+
+    def _cache_lookup_key(self, primary, messages, system_prompt, max_tokens, use_cache):
+        """
+        Get the agent's cache TTL and the response cache key for a request.
+
+        Returns:
+            (cache_ttl, cache_key) - cache_key is None when caching is off
+        """
+        cache_ttl = self.agent_config.get("cache_ttl", DEFAULT_CACHE_TTL_SECONDS)
+        if not use_cache or cache_ttl <= 0:
+            return cache_ttl, None
+        cache_key = ResponseCache.make_key(
+            agent=self.agent_name,
+            provider=primary,
+            model=self.config.get("providers", {}).get(primary, {}).get("model"),
+            messages=messages,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+        )
+        return cache_ttl, cache_key
+
+    def _check_limits(self) -> None:
+        """
+        Check the agent's daily request quota and the monthly cost limit, and
+        reserve a request against the quota (release it with _release_request()).
+
+        The usage log is read at most every LIMIT_CHECK_TTL_SECONDS; in between,
+        requests recorded by this client are added to the last reading. Requests
+        that passed the check but haven't finished count too, so concurrent
+        calls (acall_many) can't all pass a quota that only fits some of them.
+
+        Raises:
+            ValueError: If either limit is exceeded (nothing is reserved)
+        """
+        request_limit = self.agent_config.get("rate_limit", {}).get("requests_per_day", 100)
+        cost_limit = self.config.get("usage_control", {}).get("cost_tracking", {}).get("hard_limit_dollars", 100)
+
+        with self._usage_lock:
+            snapshot = self._limit_snapshot
+            counted = (self._requests_since_snapshot, self._cost_since_snapshot)
+        if snapshot is None or snapshot[0] <= time.monotonic():
+            # Drain and re-read the log without holding the lock: this can take a while,
+            # and acall()'s _log_usage takes the same lock on the event loop thread
+            self._usage_logger.drain()
+            _, requests_today, _ = self.usage_tracker.check_requests_per_agent_per_day(self.agent_name)
+            _, cost, _ = self.usage_tracker.check_cost_limit()
+            with self._usage_lock:
+                # Install it unless another thread refreshed the snapshot in the meantime
+                if self._limit_snapshot is snapshot:
+                    self._limit_snapshot = (time.monotonic() + LIMIT_CHECK_TTL_SECONDS, requests_today, cost)
+                    # Requests logged before the drain are in the new reading; keep counting
+                    # the ones logged since (if they made the reading too, they count twice
+                    # until the next refresh, erring on the safe side)
+                    self._requests_since_snapshot -= counted[0]
+                    self._cost_since_snapshot -= counted[1]
+
+        with self._usage_lock:
+            requests_today = (
+                self._limit_snapshot[1] + self._requests_since_snapshot + self._requests_in_flight
+            )
+            cost = self._limit_snapshot[2] + self._cost_since_snapshot
+
+            # Check rate limits
+            if requests_today >= request_limit:
+                raise ValueError(
+                    f"Daily request limit exceeded for {self.agent_name} "
+                    f"({requests_today}/{request_limit} requests today)"
+                )
+
+            # Check cost limits
+            if cost >= cost_limit:
+                raise ValueError(
+                    f"Monthly cost limit exceeded (${cost:.2f}/${cost_limit}). "
+                    f"Increase hard_limit_dollars in agency-config.json"
+                )
+
+            self._requests_in_flight += 1
+
+    def _release_request(self) -> None:
+        """
+        Release a request reserved by _check_limits() once it has finished.
+
+        A finished request that logged a usage entry is counted from then on
+        through the log; one that didn't (e.g. no usable provider) frees its slot.
+        """
+        with self._usage_lock:
+            self._requests_in_flight -= 1
+
+    def _get_provider(self, provider_name: str):
+        """
+        Get the provider instance for a name, creating it on first use.
+
+        Providers are reused across calls so each SDK client keeps its HTTP
+        connection pool (no new TCP/TLS handshake per request); after the first
+        call this is a single dict lookup.
+
+        Raises:
+            ValueError: If provider is not in config, unknown or not enabled
+        """
+        provider = self._providers.get(provider_name)
+        if provider is None:
+            if provider_name not in self._enabled:
+                if provider_name not in self.config.get("providers", {}):
+                    raise ValueError(f"Provider '{provider_name}' not in config")
+                raise ValueError(f"Provider '{provider_name}' is not enabled in agency-config.json")
+            provider_config = self.config["providers"][provider_name]
+            api_key = self.credentials.get(provider_name)
+            provider = ProviderFactory.create(provider_name, provider_config, api_key)
+            self._providers[provider_name] = provider
+        return provider
+
+    def _get_bucket(self, provider_name: str) -> TokenBucket:
+        """
+        Get the token bucket limiting this agent's requests to a provider.
+
+        Sized from the provider's "rps" (default 10) and "burst" (default rps)
+        in agency-config.json.
+        """
+        key = (provider_name, self.agent_name)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            provider_config = self.config["providers"][provider_name]
+            rps = provider_config.get("rps", DEFAULT_PROVIDER_RPS)
+            burst = provider_config.get("burst", max(1, rps))
+            with self._buckets_lock:
+                bucket = self._buckets.setdefault(key, TokenBucket(rps, burst))
+        return bucket
+
+    def _log_usage(self, **entry) -> None:
+        """Queue a usage log entry (UsageTracker.make_log_entry fields) for the background writer"""
+        log_entry = self.usage_tracker.make_log_entry(**entry)
+        # Queued under the lock so a limit-check refresh either drains it or counts it
+        with self._usage_lock:
+            self._usage_logger.submit(log_entry)
+            self._requests_since_snapshot += 1
+            if log_entry["status"] == "success":
+                self._cost_since_snapshot += log_entry["cost_usd"]
+
+    def _flush(self) -> None:
+        """Wait until queued usage log entries are written to the usage log"""
+        self._usage_logger.drain()
+
+    def _record_success(self, provider_name, response, max_tokens, cache_key, cache_ttl, elapsed) -> None:
+        """Log a successful call, update provider health and store it in the response cache"""
+        self._health[provider_name].record(True, elapsed * 1000)
+        self._log_usage(
+            agent_name=self.agent_name,
+            provider=provider_name,
+            tokens_in=response.input_tokens,
+            tokens_out=response.output_tokens,
+            cost=response.cost_usd,
+            status="success",
+            metadata={"max_tokens": max_tokens},
+        )
+
+        if cache_key is not None:
+            self._response_cache.set(cache_key, response, cache_ttl)
+
+    def _handle_provider_failure(self, provider_name, providers_to_try, error) -> None:
+        """
+        Report a failed provider so the caller can try the next fallback.
+
+        Raises:
+            Exception: If this was the last provider to try
+        """
+        cooldown = self.config["api"].get("provider_cooldown_seconds", DEFAULT_PROVIDER_COOLDOWN_SECONDS)
+        self._health[provider_name].record(False, cooldown_seconds=cooldown)
+
+        if provider_name == providers_to_try[-1]:
+            # Last provider failed
+            self._log_usage(
+                agent_name=self.agent_name,
+                provider=provider_name,
+                tokens_in=0,
+                tokens_out=0,
+                cost=0,
+                status="failure",
+                metadata={"error": str(error)},
+            )
+            raise Exception(f"All providers failed. Last error: {error}") from error
+
+        # Try next provider
+        logger.warning("Provider %s failed: %s. Trying fallback...", provider_name, error)
+
+    def _call_with_retries(self, provider, messages, system_prompt, max_tokens, max_attempts=3, bucket=None):
+        """
+        Call provider with capped linear backoff and jitter.
+
+        Each attempt first takes a token from the provider's bucket, waiting
+        if the agent is over its request rate.
+
+        Waits min(retry_backoff_base * attempt, retry_backoff_cap_ms / 1000)
+        seconds (0.1s, 0.2s, ... up to 0.5s by default) scaled by a random
+        50-100% jitter, or longer if the provider sent a Retry-After header.
+        Errors with a non-retryable HTTP status (bad request, authentication,
+        permission, not found) are raised immediately.
 
         Args:
             provider: Provider instance
@@ -183,6 +690,7 @@ class APIClient:
             system_prompt: System message
             max_tokens: Max tokens
             max_attempts: Max retry attempts
+            bucket: Optional TokenBucket to acquire before each attempt
 
         Returns:
             APIResponse
@@ -191,23 +699,63 @@ class APIClient:
             Exception: If all retries fail
         """
         for attempt in range(max_attempts):
+            if bucket is not None:
+                wait = bucket.acquire(1)
+                if wait:
+                    time.sleep(wait)
             try:
                 return provider.call(messages, system_prompt, max_tokens)
 
             except Exception as e:
-                if attempt < max_attempts - 1:
-                    wait_time = self.config["api"].get("retry_backoff_base", 2) ** attempt
-                    print(f"Attempt {attempt + 1}/{max_attempts} failed. Retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
+                if getattr(e, "status_code", None) in _NON_RETRYABLE_STATUS or attempt == max_attempts - 1:
+                    raise
+                wait_time = self._retry_wait(attempt, e)
+                logger.info("Attempt %d/%d failed; retrying in %.2fs", attempt + 1, max_attempts, wait_time)
+                time.sleep(wait_time)
+
+    async def _acall_with_retries(
+        self, provider, messages, system_prompt, max_tokens, max_attempts=3, bucket=None
+    ):
+        """
+        Async version of _call_with_retries(), using provider.acall and asyncio.sleep.
+
+        Raises:
+            Exception: If all retries fail
+        """
+        for attempt in range(max_attempts):
+            if bucket is not None:
+                wait = bucket.acquire(1)
+                if wait:
+                    await asyncio.sleep(wait)
+            try:
+                return await provider.acall(messages, system_prompt, max_tokens)
+
+            except Exception as e:
+                if getattr(e, "status_code", None) in _NON_RETRYABLE_STATUS or attempt == max_attempts - 1:
                     raise
+                wait_time = self._retry_wait(attempt, e)
+                logger.info("Attempt %d/%d failed; retrying in %.2fs", attempt + 1, max_attempts, wait_time)
+                await asyncio.sleep(wait_time)
+
+    def _retry_wait(self, attempt: int, error: Exception) -> float:
+        """Seconds to wait before retrying after a failed attempt (0-based)"""
+        api_config = self.config["api"]
+        base = api_config.get("retry_backoff_base", DEFAULT_RETRY_BACKOFF_BASE)
+        cap = api_config.get("retry_backoff_cap_ms", DEFAULT_RETRY_BACKOFF_CAP_MS) / 1000
+        wait_time = min(base * (attempt + 1), cap) * random.uniform(0.5, 1.0)
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            wait_time = max(wait_time, retry_after)
+        return wait_time
 
     def get_summary(self) -> dict:
         """Get usage summary for this agent"""
+        self._flush()
         return self.usage_tracker.get_usage_summary()
 
     def print_summary(self) -> None:
         """Print usage summary"""
+        self._flush()
         self.usage_tracker.print_summary()
 
     def print_status(self) -> None:
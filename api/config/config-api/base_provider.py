@@ -1,10 +1,19 @@
+import asyncio
+import hashlib
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+# Seconds a successful API key validation is trusted before calling the provider again
+VALIDATION_TTL_SECONDS = 24 * 60 * 60
+
+# (provider name, sha256 of API key) -> (valid, checked_at); shared by all provider instances
+_VALIDATION_CACHE: dict[tuple[str, str], tuple[bool, float]] = {}
+
+@dataclass(slots=True, frozen=True)
 class APIResponse:
-    """Unified response format across all providers"""
+    """Unified response format across all providers (immutable; cached responses are shared)"""
     content: str
     model: str
     input_tokens: int
@@ -20,6 +29,9 @@ class BaseProvider(ABC):
     Ensures consistent behavior across Claude, ChatGPT, Grok, etc.
     """
 
+    # Provider key as used in agency-config.json and APIResponse.provider
+    PROVIDER_NAME = ""
+
     def __init__(self, config: dict, api_key: str):
         """
         Initialize provider.
@@ -30,7 +42,6 @@ class BaseProvider(ABC):
         """
         self.config = config
         self.api_key = api_key
-        self.provider_name = self.__class__.__name__
 
     @abstractmethod
     def call(
@@ -52,6 +63,28 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def acall(
+        self,
+        messages: list,
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None
+    ) -> APIResponse:
+        """
+        Async version of call().
+
+        Default runs call() in a worker thread; providers with an async SDK
+        client override this to await the request directly.
+
+        Args:
+            messages: List of messages in format: [{"role": "user", "content": "..."}]
+            system_prompt: Optional system message
+            max_tokens: Max tokens in response
+
+        Returns:
+            APIResponse with standardized fields
+        """
+        return await asyncio.to_thread(self.call, messages, system_prompt, max_tokens)
+
     @abstractmethod
     def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """
@@ -76,6 +109,42 @@ class BaseProvider(ABC):
         """
         pass
 
+    def _cached_validation(self) -> Optional[bool]:
+        """Result of a recent validate_api_key() for this provider and key, or None"""
+        entry = _VALIDATION_CACHE.get(self._validation_key())
+        if entry is not None and time.monotonic() - entry[1] < VALIDATION_TTL_SECONDS:
+            return entry[0]
+        return None
+
+    def _store_validation(self, valid: bool) -> bool:
+        """
+        Remember a validate_api_key() result and return it.
+
+        Only successes are cached; a failure may be a transient network error,
+        so the next validation calls the provider again.
+        """
+        if valid:
+            _VALIDATION_CACHE[self._validation_key()] = (True, time.monotonic())
+        return valid
+
+    def _validation_key(self) -> tuple[str, str]:
+        """Validation cache key (the API key itself is never stored)"""
+        return (self.PROVIDER_NAME, hashlib.sha256(self.api_key.encode()).hexdigest())
+
+    @classmethod
+    async def validate_all_async(cls, providers: list) -> dict:
+        """
+        Validate several providers' API keys concurrently.
+
+        Args:
+            providers: Provider instances
+
+        Returns:
+            Dict of provider name -> True if key is valid
+        """
+        results = await asyncio.gather(*(asyncio.to_thread(p.validate_api_key) for p in providers))
+        return {p.PROVIDER_NAME: valid for p, valid in zip(providers, results)}
+
     def get_provider_name(self) -> str:
         """Get human-readable provider name"""
-        return self.config.get("name", self.provider_name)
+        return self.config.get("name", self.PROVIDER_NAME)
@@ -3,9 +3,12 @@ Credentials Manager
 Manages API keys securely from environment variables
 """
 
+import logging
 import os
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 class CredentialsManager:
     """
@@ -25,6 +28,14 @@ class CredentialsManager:
         self.config = config
         self._cache = {}
 
+        # Resolve enabled providers' keys up front so get() is a dict lookup;
+        # missing keys are left to get() to report
+        for name, provider_config in config.get("providers", {}).items():
+            if provider_config.get("enabled"):
+                env_var = provider_config.get("api_key_env_var")
+                if env_var and (api_key := os.environ.get(env_var)):
+                    self._cache[name.lower()] = api_key
+
     def get(self, provider_name: str) -> str:
         """
         Get API key for a provider from environment.
@@ -38,6 +49,10 @@ class CredentialsManager:
         Raises:
             ValueError: If API key not found in environment
         """
+        api_key = self._cache.get(provider_name)
+        if api_key is not None:
+            return api_key
+
         provider_name_lower = provider_name.lower()
 
         # Check cache first
@@ -119,3 +134,11 @@ class CredentialsManager:
                 print(f"✗ {provider_name:15} - {reason}")
 
         print("=" * 70 + "\n")
+
+    def log_status(self) -> None:
+        """Log credential status for all providers (for batch runs; print_status for the CLI)"""
+        for provider_name, info in self.validate_all().items():
+            if info["available"]:
+                logger.info("Credentials %s: ready", provider_name)
+            else:
+                logger.info("Credentials %s: %s", provider_name, info.get("reason", "unknown"))
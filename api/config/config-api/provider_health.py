@@ -0,0 +1,62 @@
+"""
+Provider Health
+EWMA success scores and failure cooldowns used to order providers before each call
+"""
+
+import time
+
+
+class ProviderHealth:
+    """
+    Recent health of one provider.
+
+    score is an exponentially weighted moving average of call outcomes
+    (1.0 = success, 0.0 = failure), so a few recent failures outweigh a long
+    run of old successes. While a provider is not called its score decays
+    back toward 1.0 (half-life `recovery_seconds`), so a demoted primary is
+    preferred again once its failures are old. After a failure the provider
+    is in cooldown and is tried only if no healthier provider is available.
+    """
+
+    __slots__ = ("alpha", "recovery_seconds", "score", "updated", "latency_ms", "cooldown_until")
+
+    def __init__(self, alpha: float = 0.3, recovery_seconds: float = 60):
+        """
+        Initialize as healthy.
+
+        Args:
+            alpha: Weight of the newest outcome (0-1)
+            recovery_seconds: Half-life of the decay back to full health
+        """
+        self.alpha = alpha
+        self.recovery_seconds = recovery_seconds
+        self.score = 1.0
+        self.updated = time.monotonic()
+        self.latency_ms = 0.0
+        self.cooldown_until = 0.0
+
+    def current_score(self) -> float:
+        """Score with recovery applied for the time since the last recorded call"""
+        elapsed = time.monotonic() - self.updated
+        return 1.0 - (1.0 - self.score) * 0.5 ** (elapsed / self.recovery_seconds)
+
+    def record(self, success: bool, latency_ms: float = 0.0, cooldown_seconds: float = 30) -> None:
+        """
+        Fold a call outcome into the score.
+
+        Args:
+            success: Whether the call (including retries) succeeded
+            latency_ms: Call duration; averaged for successful calls
+            cooldown_seconds: How long to deprioritize the provider after a failure
+        """
+        self.score = self.alpha * (1.0 if success else 0.0) + (1 - self.alpha) * self.current_score()
+        self.updated = time.monotonic()
+        if success:
+            self.latency_ms = self.alpha * latency_ms + (1 - self.alpha) * (self.latency_ms or latency_ms)
+            self.cooldown_until = 0.0
+        else:
+            self.cooldown_until = time.monotonic() + cooldown_seconds
+
+    def in_cooldown(self) -> bool:
+        """True while the provider is deprioritized after a failure"""
+        return self.cooldown_until > time.monotonic()
@@ -1,12 +1,14 @@
 """
 LLM Providers
 Implementations for Claude, ChatGPT, Grok, and other AI providers
+
+Provider classes are imported on first access, so using one provider doesn't
+load the other providers' SDKs.
 """
 
+from importlib import import_module
+
 from .provider_factory import ProviderFactory
-from .claude_provider import ClaudeProvider
-from .chatgpt_provider import ChatGPTProvider
-from .grok_provider import GrokProvider
 
 __all__ = [
     "ProviderFactory",
@@ -14,3 +16,19 @@ __all__ = [
     "ChatGPTProvider",
     "GrokProvider",
 ]
+
+# Lazily imported provider classes -> defining module
+_LAZY_PROVIDERS = {
+    "ClaudeProvider": ".claude_provider",
+    "ChatGPTProvider": ".chatgpt_provider",
+    "GrokProvider": ".grok_provider",
+}
+
+
+def __getattr__(name):
+    """Import provider classes on first access (PEP 562)"""
+    if name in _LAZY_PROVIDERS:
+        provider_class = getattr(import_module(_LAZY_PROVIDERS[name], __name__), name)
+        globals()[name] = provider_class
+        return provider_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,19 @@ ChatGPT Provider Implementation (Scaffolded)
 Uses OpenAI's GPT API
 """
 
+import asyncio
+import json
+import logging
+import time
+
 from ..base_provider import BaseProvider, APIResponse
+from .http_client import get_shared_async_http_client, get_shared_http_client
+
+logger = logging.getLogger(__name__)
+
+
+# OpenAI Batch API price as a fraction of the synchronous price
+BATCH_DISCOUNT = 0.5
 
 
 class ChatGPTProvider(BaseProvider):
@@ -19,20 +31,32 @@ class ChatGPTProvider(BaseProvider):
     4. Use: python script.py --provider=chatgpt
     """
 
+    PROVIDER_NAME = "chatgpt"
+
     def __init__(self, config: dict, api_key: str):
-        """Initialize OpenAI client"""
+        """Initialize OpenAI client on the shared keep-alive HTTP client"""
         super().__init__(config, api_key)
 
+        # Per-token USD rates, computed once from config billing
+        billing = config["billing"]
+        self._in_rate = billing["input_per_mtok"] / 1000.0
+        self._out_rate = billing["output_per_mtok"] / 1000.0
+
         try:
             import openai
 
-            self.client = openai.OpenAI(api_key=api_key)
+            self.client = openai.OpenAI(api_key=api_key, http_client=get_shared_http_client(openai))
+            self._openai = openai
         except ImportError:
             raise ImportError(
                 "OpenAI library not installed. "
                 "Install with: pip install openai"
             )
 
+        # AsyncOpenAI client for the event loop it was created on (see acall)
+        self._async_loop = None
+        self._async_client = None
+
     def call(self, messages: list, system_prompt: str = None, max_tokens: int = None) -> APIResponse:
         """
         Call ChatGPT API.
@@ -48,18 +72,126 @@ class ChatGPTProvider(BaseProvider):
         Raises:
             ImportError: If openai library not installed
         """
-        # Build message list with system prompt if provided
-        all_messages = []
-        if system_prompt:
-            all_messages.append({"role": "system", "content": system_prompt})
-        all_messages.extend(messages)
-
         response = self.client.chat.completions.create(
             model=self.config["model"],
             max_tokens=max_tokens or self.config.get("max_tokens", 4096),
-            messages=all_messages,
+            messages=self._build_messages(messages, system_prompt),
         )
+        return self._to_api_response(response)
 
+    async def acall(self, messages: list, system_prompt: str = None, max_tokens: int = None) -> APIResponse:
+        """
+        Call ChatGPT API with the async client.
+
+        Args:
+            messages: List of messages
+            system_prompt: System message
+            max_tokens: Max tokens (uses config default if None)
+
+        Returns:
+            APIResponse with ChatGPT response
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_client = self._openai.AsyncOpenAI(
+                api_key=self.api_key, http_client=get_shared_async_http_client(self._openai)
+            )
+            self._async_loop = loop
+
+        response = await self._async_client.chat.completions.create(
+            model=self.config["model"],
+            max_tokens=max_tokens or self.config.get("max_tokens", 4096),
+            messages=self._build_messages(messages, system_prompt),
+        )
+        return self._to_api_response(response)
+
+    def call_batch(
+        self, requests: list, system_prompt: str = None, max_tokens: int = None, poll_seconds: float = 30
+    ) -> list:
+        """
+        Run requests through the OpenAI Batch API (half price, results within 24h).
+
+        Uploads the requests as one JSONL batch, polls until it finishes and
+        returns the responses in request order. Blocks while polling.
+
+        Args:
+            requests: List of {"messages": [...], "system_prompt": optional}
+            system_prompt: System message for requests that don't set their own
+            max_tokens: Max tokens per response (uses config default if None)
+            poll_seconds: Seconds between batch status checks
+
+        Returns:
+            List of APIResponse, one per request (cost includes the batch discount)
+
+        Raises:
+            RuntimeError: If the batch or any request in it fails
+        """
+        max_tokens = max_tokens or self.config.get("max_tokens", 4096)
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.config["model"],
+                    "max_tokens": max_tokens,
+                    "messages": self._build_messages(
+                        request["messages"], request.get("system_prompt") or system_prompt
+                    ),
+                },
+            })
+            for i, request in enumerate(requests)
+        ]
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        while batch.status in ("validating", "in_progress", "finalizing"):
+            time.sleep(poll_seconds)
+            batch = self.client.batches.retrieve(batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+
+        responses = [None] * len(requests)
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                raise RuntimeError(
+                    f"OpenAI batch request {record['custom_id']} failed: "
+                    f"{record.get('error') or response.get('body')}"
+                )
+            body = response["body"]
+            input_tokens = body["usage"]["prompt_tokens"]
+            output_tokens = body["usage"]["completion_tokens"]
+            responses[int(record["custom_id"])] = APIResponse(
+                content=body["choices"][0]["message"]["content"],
+                model=self.config["model"],
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost_usd=round(self.calculate_cost(input_tokens, output_tokens) * BATCH_DISCOUNT, 6),
+                provider=self.PROVIDER_NAME,
+            )
+
+        if None in responses:
+            raise RuntimeError(f"OpenAI batch {batch.id} is missing {responses.count(None)} result(s)")
+        return responses
+
+    @staticmethod
+    def _build_messages(messages: list, system_prompt: str = None) -> list:
+        """Build message list with system prompt if provided"""
+        all_messages = []
+        if system_prompt:
+            all_messages.append({"role": "system", "content": system_prompt})
+        all_messages.extend(messages)
+        return all_messages
+
+    def _to_api_response(self, response) -> APIResponse:
+        """Convert an OpenAI ChatCompletion to APIResponse"""
         input_tokens = response.usage.prompt_tokens
         output_tokens = response.usage.completion_tokens
         cost = self.calculate_cost(input_tokens, output_tokens)
@@ -70,7 +202,7 @@ class ChatGPTProvider(BaseProvider):
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             cost_usd=cost,
-            provider="chatgpt",
+            provider=self.PROVIDER_NAME,
         )
 
     def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
@@ -89,27 +221,29 @@ class ChatGPTProvider(BaseProvider):
         Returns:
             Total cost in USD
         """
-        billing = self.config["billing"]
-        input_cost = (input_tokens * billing["input_per_mtok"]) / 1000
-        output_cost = (output_tokens * billing["output_per_mtok"]) / 1000
-        return round(input_cost + output_cost, 6)
+        return round(input_tokens * self._in_rate + output_tokens * self._out_rate, 6)
 
     def validate_api_key(self) -> bool:
         """
         Test ChatGPT API key validity.
 
-        Makes a minimal API call to verify credentials.
+        Makes a minimal API call to verify credentials. A successful result is
+        cached for 24h per API key, so repeated startup checks skip the call.
 
         Returns:
             True if key is valid, False otherwise
         """
+        cached = self._cached_validation()
+        if cached is not None:
+            return cached
+
         try:
             response = self.client.chat.completions.create(
                 model=self.config["model"],
                 max_tokens=10,
                 messages=[{"role": "user", "content": "test"}],
             )
-            return bool(response)
+            return self._store_validation(bool(response))
         except Exception as e:
-            print(f"ChatGPT API key validation failed: {e}")
+            logger.warning("ChatGPT API key validation failed: %s", e)
             return False
@@ -3,8 +3,13 @@ Claude Provider Implementation
 Uses Anthropic's Claude API
 """
 
-import anthropic
+import asyncio
+import logging
+
 from ..base_provider import BaseProvider, APIResponse
+from .http_client import get_shared_async_http_client, get_shared_http_client
+
+logger = logging.getLogger(__name__)
 
 
 class ClaudeProvider(BaseProvider):
@@ -13,10 +18,30 @@ class ClaudeProvider(BaseProvider):
     Supports all Claude models from Anthropic.
     """
 
+    PROVIDER_NAME = "claude"
+
     def __init__(self, config: dict, api_key: str):
-        """Initialize Anthropic client"""
+        """Initialize Anthropic client on the shared keep-alive HTTP client"""
         super().__init__(config, api_key)
-        self.client = anthropic.Anthropic(api_key=api_key)
+
+        # Imported here so loading the providers package doesn't import every SDK
+        import anthropic
+
+        self._anthropic = anthropic
+
+        # Per-token USD rates, computed once from config billing
+        billing = config["billing"]
+        input_per_mtok = billing["input_per_mtok"]
+        self._in_rate = input_per_mtok / 1000.0
+        self._out_rate = billing["output_per_mtok"] / 1000.0
+        # Prompt cache reads bill at 0.1x input and cache writes at 1.25x unless configured
+        self._cache_read_rate = billing.get("cache_read_per_mtok", 0.1 * input_per_mtok) / 1000.0
+        self._cache_write_rate = billing.get("cache_write_per_mtok", 1.25 * input_per_mtok) / 1000.0
+
+        self.client = anthropic.Anthropic(api_key=api_key, http_client=get_shared_http_client(anthropic))
+        # AsyncAnthropic client for the event loop it was created on (see acall)
+        self._async_loop = None
+        self._async_client = None
 
     def call(self, messages: list, system_prompt: str = None, max_tokens: int = None) -> APIResponse:
         """
@@ -33,22 +58,70 @@ class ClaudeProvider(BaseProvider):
         response = self.client.messages.create(
             model=self.config["model"],
             max_tokens=max_tokens or self.config.get("max_tokens", 4096),
-            system=system_prompt,
+            system=self._system_blocks(system_prompt),
+            messages=messages,
+        )
+        return self._to_api_response(response)
+
+    async def acall(self, messages: list, system_prompt: str = None, max_tokens: int = None) -> APIResponse:
+        """
+        Call Claude API with the async client.
+
+        Args:
+            messages: List of messages
+            system_prompt: System message
+            max_tokens: Max tokens (uses config default if None)
+
+        Returns:
+            APIResponse with Claude response
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_client = self._anthropic.AsyncAnthropic(
+                api_key=self.api_key, http_client=get_shared_async_http_client(self._anthropic)
+            )
+            self._async_loop = loop
+
+        response = await self._async_client.messages.create(
+            model=self.config["model"],
+            max_tokens=max_tokens or self.config.get("max_tokens", 4096),
+            system=self._system_blocks(system_prompt),
             messages=messages,
         )
+        return self._to_api_response(response)
+
+    def _system_blocks(self, system_prompt: str = None):
+        """
+        System prompt as a cacheable content block.
 
-        cost = self.calculate_cost(response.usage.input_tokens, response.usage.output_tokens)
+        Marking it with cache_control lets Anthropic reuse the encoded prompt
+        across calls (cache reads bill at a tenth of the input price); prompts
+        shorter than the model's minimum cacheable length are sent uncached.
+        """
+        if not system_prompt:
+            return self._anthropic.NOT_GIVEN
+        return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+    def _to_api_response(self, response) -> APIResponse:
+        """Convert an Anthropic Message to APIResponse (input_tokens includes cached prompt tokens)"""
+        usage = response.usage
+        # Older SDKs' Usage has no cache fields (and they're None when caching didn't apply)
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        cost = self.calculate_cost(usage.input_tokens, usage.output_tokens, cache_read, cache_write)
 
         return APIResponse(
             content=response.content[0].text,
             model=self.config["model"],
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
+            input_tokens=usage.input_tokens + cache_read + cache_write,
+            output_tokens=usage.output_tokens,
             cost_usd=cost,
-            provider="claude",
+            provider=self.PROVIDER_NAME,
         )
 
-    def calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
+    def calculate_cost(
+        self, input_tokens: int, output_tokens: int, cache_read_tokens: int = 0, cache_write_tokens: int = 0
+    ) -> float:
         """
         Calculate Claude cost based on current pricing.
 
@@ -57,34 +130,47 @@ class ClaudeProvider(BaseProvider):
         - Claude Opus 4.6  (claude-opus-4-6):    $15/$75 per MTok
         - Claude Haiku 4.5 (claude-haiku-4-5):   $0.80/$4 per MTok
 
+        Prompt caching: cache reads bill at 0.1x and cache writes at 1.25x the
+        input price (override with billing cache_read_per_mtok / cache_write_per_mtok).
+
         Args:
-            input_tokens: Input token count
+            input_tokens: Uncached input token count
             output_tokens: Output token count
+            cache_read_tokens: Input tokens read from the prompt cache
+            cache_write_tokens: Input tokens written to the prompt cache
 
         Returns:
             Total cost in USD
         """
-        billing = self.config["billing"]
-        input_cost = (input_tokens * billing["input_per_mtok"]) / 1000
-        output_cost = (output_tokens * billing["output_per_mtok"]) / 1000
-        return round(input_cost + output_cost, 6)
+        return round(
+            input_tokens * self._in_rate
+            + output_tokens * self._out_rate
+            + cache_read_tokens * self._cache_read_rate
+            + cache_write_tokens * self._cache_write_rate,
+            6,
+        )
 
     def validate_api_key(self) -> bool:
         """
         Test Claude API key validity.
 
-        Makes a minimal API call to verify credentials.
+        Makes a minimal API call to verify credentials. A successful result is
+        cached for 24h per API key, so repeated startup checks skip the call.
 
         Returns:
             True if key is valid, False otherwise
         """
+        cached = self._cached_validation()
+        if cached is not None:
+            return cached
+
         try:
             response = self.client.messages.create(
                 model=self.config["model"],
                 max_tokens=10,
                 messages=[{"role": "user", "content": "test"}],
             )
-            return bool(response)
+            return self._store_validation(bool(response))
         except Exception as e:
-            print(f"Claude API key validation failed: {e}")
+            logger.warning("Claude API key validation failed: %s", e)
             return False
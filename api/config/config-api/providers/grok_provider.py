@@ -3,8 +3,12 @@ Grok Provider Implementation (Scaffolded)
 Uses xAI's Grok API
 """
 
+import logging
+
 from ..base_provider import BaseProvider, APIResponse
 
+logger = logging.getLogger(__name__)
+
 
 class GrokProvider(BaseProvider):
     """
@@ -22,10 +26,17 @@ class GrokProvider(BaseProvider):
     Update implementation based on official xAI documentation.
     """
 
+    PROVIDER_NAME = "grok"
+
     def __init__(self, config: dict, api_key: str):
         """Initialize Grok client"""
         super().__init__(config, api_key)
 
+        # Per-token USD rates from config billing (placeholder pricing - update when official pricing released)
+        billing = config["billing"]
+        self._in_rate = billing.get("input_per_mtok", 0.002) / 1000.0
+        self._out_rate = billing.get("output_per_mtok", 0.01) / 1000.0
+
         try:
             # Placeholder - actual import depends on xAI's library
             # This will likely be different when Grok API is officially released
@@ -73,11 +84,7 @@ class GrokProvider(BaseProvider):
         Returns:
             Total cost in USD
         """
-        # Placeholder pricing - update when official pricing released
-        billing = self.config["billing"]
-        input_cost = (input_tokens * billing.get("input_per_mtok", 0.002)) / 1000
-        output_cost = (output_tokens * billing.get("output_per_mtok", 0.01)) / 1000
-        return round(input_cost + output_cost, 6)
+        return round(input_tokens * self._in_rate + output_tokens * self._out_rate, 6)
 
     def validate_api_key(self) -> bool:
         """
@@ -92,5 +99,5 @@ class GrokProvider(BaseProvider):
             # Placeholder - implement once xAI API is available
             return False
         except Exception as e:
-            print(f"Grok API key validation failed: {e}")
+            logger.warning("Grok API key validation failed: %s", e)
             return False
@@ -0,0 +1,72 @@
+"""
+Shared HTTP Client
+One keep-alive connection pool per provider SDK, shared by every provider instance
+"""
+
+import asyncio
+from functools import lru_cache
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in the SDKs' httpx transport)
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# (event loop, async client) by SDK name; an async connection pool is bound to the
+# loop that opened it, so a new loop (e.g. each asyncio.run) gets a new client
+_async_clients = {}
+
+
+def _connection_limits(sdk):
+    """Connection pool limits, built with the SDK's own Limits class"""
+    return type(sdk.DEFAULT_CONNECTION_LIMITS)(
+        max_connections=50,
+        max_keepalive_connections=20,
+        keepalive_expiry=30,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_shared_http_client(sdk):
+    """
+    Get the process-wide HTTP client to pass to an SDK's `http_client` argument.
+
+    Sharing one client keeps TCP/TLS connections alive across provider
+    instances and APIClient objects, with a longer keep-alive window than the
+    SDK default. HTTP/2 multiplexing is used when the optional `h2` package is
+    installed (pip install h2); otherwise HTTP/1.1 with keep-alive.
+
+    The client is built with the SDK's own DefaultHttpxClient (and Limits
+    class), so it keeps the SDK's default timeout, redirect and socket
+    settings and matches the httpx package the SDK was built against.
+
+    Args:
+        sdk: Provider SDK module (`anthropic` or `openai`)
+
+    Returns:
+        Shared HTTP client (do not close it)
+    """
+    return sdk.DefaultHttpxClient(http2=_HTTP2_AVAILABLE, limits=_connection_limits(sdk))
+
+
+def get_shared_async_http_client(sdk):
+    """
+    Get the async HTTP client for an SDK on the running event loop.
+
+    Async counterpart of get_shared_http_client(): one client per SDK for
+    the current event loop, with the same limits and HTTP/2 setting. Must be
+    called from inside a coroutine.
+
+    Args:
+        sdk: Provider SDK module (`anthropic` or `openai`)
+
+    Returns:
+        Shared async HTTP client (do not close it)
+    """
+    loop = asyncio.get_running_loop()
+    client_loop, client = _async_clients.get(sdk.__name__, (None, None))
+    if client_loop is not loop:
+        client = sdk.DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE, limits=_connection_limits(sdk))
+        _async_clients[sdk.__name__] = (loop, client)
+    return client
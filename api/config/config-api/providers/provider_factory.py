@@ -3,9 +3,7 @@ Provider Factory
 Routes agent calls to the correct LLM provider
 """
 
-from .claude_provider import ClaudeProvider
-from .chatgpt_provider import ChatGPTProvider
-from .grok_provider import GrokProvider
+from importlib import import_module
 
 
 class ProviderFactory:
@@ -13,12 +11,15 @@ class ProviderFactory:
     Factory pattern for creating provider instances.
 
     Manages which providers are available and routes to the correct one.
+    Providers are registered as "module:Class" paths (relative to this package)
+    and imported on first use, so only the SDKs of providers actually created
+    are loaded. A provider class may also be registered directly.
     """
 
     PROVIDERS = {
-        "claude": ClaudeProvider,
-        "chatgpt": ChatGPTProvider,
-        "grok": GrokProvider,
+        "claude": "claude_provider:ClaudeProvider",
+        "chatgpt": "chatgpt_provider:ChatGPTProvider",
+        "grok": "grok_provider:GrokProvider",
     }
 
     @staticmethod
@@ -52,6 +53,10 @@ class ProviderFactory:
             )
 
         provider_class = ProviderFactory.PROVIDERS[provider_name_lower]
+        if isinstance(provider_class, str):
+            module_name, class_name = provider_class.split(":")
+            provider_class = getattr(import_module(f".{module_name}", __package__), class_name)
+            ProviderFactory.PROVIDERS[provider_name_lower] = provider_class
         return provider_class(config, api_key)
 
     @staticmethod
@@ -0,0 +1,53 @@
+"""
+Rate Limiter
+Client-side token bucket that keeps outbound requests under provider rate limits
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Holds up to `capacity` tokens and refills at `rate` tokens per second.
+    acquire() reserves tokens immediately and returns how long the caller
+    must wait before sending, so concurrent callers are spaced out instead
+    of all firing at once and getting 429s back from the provider.
+    """
+
+    __slots__ = ("capacity", "rate", "tokens", "last", "_lock")
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize bucket (starts full).
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum tokens (largest burst sent without waiting)
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: int = 1) -> float:
+        """
+        Take n tokens.
+
+        Args:
+            n: Tokens to take (1 per request)
+
+        Returns:
+            Seconds to wait before sending (0.0 if tokens were available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= n
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
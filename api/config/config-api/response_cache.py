@@ -0,0 +1,80 @@
+"""
+Response Cache
+In-memory LRU cache with per-entry TTL for identical LLM requests
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+try:
+    import orjson  # optional: faster, allocation-light key encoding
+except ImportError:
+    orjson = None
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache whose entries expire after a per-entry TTL.
+
+    Used by APIClient to return the previous response for an identical request
+    (same agent, provider, model, messages, system prompt and max tokens)
+    instead of paying the LLM round trip and token cost again.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries before least-recently-used eviction
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**parts) -> str:
+        """
+        Build a cache key from request parts.
+
+        Args:
+            **parts: JSON-serializable request fields
+
+        Returns:
+            Hex digest of the canonical JSON encoding
+        """
+        if orjson is not None:
+            encoded = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            encoded = json.dumps(parts, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds, evicting the oldest entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
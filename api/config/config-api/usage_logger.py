@@ -0,0 +1,123 @@
+"""
+Usage Logger
+Writes usage log entries from a background thread, off the API call path
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Running loggers by log file, so every client writing the same log shares one thread
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+class UsageLogger:
+    """
+    Fire-and-forget writer in front of UsageTracker.log_batch.
+
+    submit() only enqueues the entry; a daemon thread collects entries into
+    batches (up to `batch_size`, or whatever arrived within `flush_interval`
+    seconds of the first one) and appends each batch with one log write.
+    drain() blocks until everything submitted so far is on disk, and runs
+    automatically at exit.
+
+    Clients should get their logger from shared(), which starts one writer per
+    log file rather than a thread (and exit hook) per client.
+    """
+
+    def __init__(self, usage_tracker, batch_size: int = 64, flush_interval: float = 1.0):
+        """
+        Initialize logger (call start() to begin writing).
+
+        Args:
+            usage_tracker: UsageTracker whose log_batch() writes the entries
+            batch_size: Maximum entries per write
+            flush_interval: Maximum seconds an entry waits before being written
+        """
+        self.usage_tracker = usage_tracker
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._q = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="usage-logger", daemon=True)
+
+    @classmethod
+    def shared(cls, usage_tracker, batch_size: int = 64, flush_interval: float = 1.0) -> "UsageLogger":
+        """
+        Get the running logger for usage_tracker's log file, starting it on first use.
+
+        Later callers for the same file reuse the first logger (and its settings);
+        entries are still written through the first tracker's log_batch().
+
+        Args:
+            usage_tracker: UsageTracker whose log_batch() writes the entries
+            batch_size: Maximum entries per write
+            flush_interval: Maximum seconds an entry waits before being written
+
+        Returns:
+            Started UsageLogger shared by all clients logging to the same file
+        """
+        key = usage_tracker.track_file.resolve()
+        with _shared_lock:
+            usage_logger = _shared.get(key)
+            if usage_logger is None:
+                usage_logger = cls(usage_tracker, batch_size=batch_size, flush_interval=flush_interval)
+                usage_logger.start()
+                _shared[key] = usage_logger
+            return usage_logger
+
+    def start(self) -> None:
+        """Start the background writer and register drain() to run at exit"""
+        self._thread.start()
+        atexit.register(self.drain)
+
+    def submit(self, entry: dict) -> None:
+        """Queue a log entry from UsageTracker.make_log_entry() for writing"""
+        self._q.put(entry)
+
+    def drain(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until all entries submitted before this call are written.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if drained, False on timeout (or if the writer isn't running)
+        """
+        if not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        self._q.put(done)
+        return done.wait(timeout)
+
+    def _run(self) -> None:
+        """Writer loop: batch queued entries, write them, release drain() waiters"""
+        while True:
+            item = self._q.get()
+            batch, waiters = [], []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                try:
+                    self.usage_tracker.log_batch(batch)
+                except Exception:
+                    logger.exception("Failed to write %d usage log entries", len(batch))
+            for waiter in waiters:
+                waiter.set()
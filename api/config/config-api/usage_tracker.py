@@ -3,18 +3,65 @@ Usage Tracker
 Tracks API usage and costs across all providers
 """
 
+import copy
 import json
+import mmap
+import operator
 import os
+import sys
+import threading
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import orjson  # optional: faster log parsing and writing (same file format)
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl  # POSIX only: advisory lock around appends
+except ImportError:
+    fcntl = None
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dump_line(entry: dict) -> bytes:
+        """Encode one log entry as a compact JSON line (dates and datetimes encoded natively)"""
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+
+else:
+    _loads = json.loads
+    _isoformat = operator.methodcaller("isoformat")
+
+    def _dump_line(entry: dict) -> bytes:
+        """Encode one log entry as a compact JSON line (dates and datetimes as ISO 8601)"""
+        return (json.dumps(entry, separators=(",", ":"), default=_isoformat) + "\n").encode()
+
+
+# Costs are aggregated as integer micro-dollars, so sums are exact and
+# converted to dollars once per summary
+MICRO = 1_000_000
+
+
+# Format of the saved per-day rollups; rollups of another version are rebuilt from the day file
+ROLLUP_VERSION = 2
+
+
+def _empty_stats() -> dict:
+    """Zeroed calls/tokens/cost bucket for one provider or agent"""
+    return {"calls": 0, "tokens": 0, "cost_micro": 0}
 
 
 class UsageTracker:
     """
     Track API usage and costs across all providers.
 
-    Maintains a JSON log of all API calls with:
+    Maintains append-only JSON Lines logs (one entry per line, one file per day,
+    e.g. api-usage-2026-02-15.jsonl) of all API calls with:
     - Timestamp
     - Provider used
     - Agent that made the call
@@ -34,9 +81,27 @@ class UsageTracker:
         # Resolve log path relative to this file's directory (system-google-sheets-addon/config/config-api/)
         # so it works regardless of the working directory the agent is launched from.
         _base = Path(__file__).parent.parent.parent  # → system-google-sheets-addon/
-        relative = config.get("usage_control", {}).get("track_file", "config/logs/api-usage.json")
-        self.log_file = _base / relative
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        relative = config.get("usage_control", {}).get("track_file", "config/logs/api-usage.jsonl")
+        self.track_file = track_file = _base / relative
+        # Entries are partitioned into one file per day next to track_file:
+        # config/logs/api-usage.jsonl → config/logs/api-usage-YYYY-MM-DD.jsonl
+        self.log_dir = track_file.parent
+        self._stem = track_file.stem
+        self._suffix = track_file.suffix or ".jsonl"
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        # Serializes summary refreshes for clients shared across threads (appends need no lock)
+        self._lock = threading.Lock()
+        self._migrate_legacy_log()
+        # Running aggregates per day, built by one scan of each day file on first use and
+        # then advanced over only the bytes appended since (see _refresh_day)
+        self._days = {}
+        # Finished days whose current aggregates are saved as a rollup (loaded or written)
+        self._rolled_up = set()
+        # Day files found by the last directory scan, keyed by the directory's mtime
+        # (which changes when files are added or removed, not on append)
+        self._listing = (None, ())
+        # Last merged summary, keyed by the (day, bytes folded) it covers
+        self._merged = (None, None)
 
     def log_request(
         self,
@@ -60,27 +125,68 @@ class UsageTracker:
             status: "success" or "failure"
             metadata: Optional additional metadata
         """
+        self.log_batch(
+            [self.make_log_entry(agent_name, provider, tokens_in, tokens_out, cost, status, metadata)]
+        )
+
+    @staticmethod
+    def make_log_entry(
+        agent_name: str,
+        provider: str,
+        tokens_in: int,
+        tokens_out: int,
+        cost: float,
+        status: str = "success",
+        metadata: Optional[dict] = None,
+    ) -> dict:
+        """
+        Build a log entry timestamped now, for log_batch().
+
+        Args: same as log_request()
+
+        Returns:
+            Log entry dict
+        """
+        now = datetime.now()
+        cost_micro = round(cost * MICRO)
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,  # written as ISO 8601 by _dump_line
+            "date": now.date(),  # YYYY-MM-DD on disk; lets daily checks compare strings, not parse timestamps
             "agent": agent_name,
             "provider": provider,
             "tokens_in": tokens_in,
             "tokens_out": tokens_out,
             "total_tokens": tokens_in + tokens_out,
-            "cost_usd": round(cost, 4),
+            "cost_usd": cost_micro / MICRO,
+            "cost_micro": cost_micro,
             "status": status,
         }
 
         if metadata:
             log_entry["metadata"] = metadata
 
-        # Load existing logs
-        logs = self._load_logs()
-        logs.append(log_entry)
+        return log_entry
+
+    def log_batch(self, entries: list) -> None:
+        """
+        Append log entries as JSON lines, with a single write to each day's file.
+
+        Files are opened with O_APPEND and written under an exclusive flock,
+        so each batch lands intact at the end of the file even when several
+        threads or processes log at once.
+
+        Args:
+            entries: Entries from make_log_entry()
+        """
+        if not entries:
+            return
+
+        by_day = {}
+        for entry in entries:
+            by_day.setdefault(entry["date"], []).append(_dump_line(entry))
 
-        # Write back
-        with open(self.log_file, "w") as f:
-            json.dump(logs, f, indent=2)
+        for day, lines in by_day.items():
+            self._append(self._file_for(day), b"".join(lines))
 
     def get_usage_summary(self) -> dict:
         """
@@ -89,90 +195,65 @@ class UsageTracker:
         Returns:
             Dict with totals by provider and agent
         """
-        logs = self._load_logs()
-
-        summary = {
-            "total_calls": len(logs),
-            "total_tokens": 0,
-            "total_cost": 0.0,
-            "by_provider": {},
-            "by_agent": {},
-        }
-
-        for log in logs:
-            if log.get("status") != "success":
-                continue
-
-            provider = log.get("provider", "unknown")
-            agent = log.get("agent", "unknown")
-            cost = log.get("cost_usd", 0)
-            tokens = log.get("total_tokens", 0)
-
-            summary["total_cost"] += cost
-            summary["total_tokens"] += tokens
-
-            if provider not in summary["by_provider"]:
-                summary["by_provider"][provider] = {
-                    "calls": 0,
-                    "tokens": 0,
-                    "cost": 0.0,
-                }
-
-            summary["by_provider"][provider]["calls"] += 1
-            summary["by_provider"][provider]["tokens"] += tokens
-            summary["by_provider"][provider]["cost"] += cost
-
-            if agent not in summary["by_agent"]:
-                summary["by_agent"][agent] = {"calls": 0, "tokens": 0, "cost": 0.0}
-
-            summary["by_agent"][agent]["calls"] += 1
-            summary["by_agent"][agent]["tokens"] += tokens
-            summary["by_agent"][agent]["cost"] += cost
-
-        return summary
+        with self._lock:
+            self._refresh_summary()
+            return copy.deepcopy(self._merged_summary())
 
     def print_summary(self) -> None:
         """Print usage summary to console"""
         summary = self.get_usage_summary()
 
-        print("\n" + "=" * 70)
-        print("API USAGE SUMMARY")
-        print("=" * 70)
-
-        print(f"\nTotal Calls: {summary['total_calls']}")
-        print(f"Total Tokens: {summary['total_tokens']:,}")
-        print(f"Total Cost: ${summary['total_cost']:.4f}")
+        # Built as one string and written once, rather than a print() per line
+        lines = [
+            "",
+            "=" * 70,
+            "API USAGE SUMMARY",
+            "=" * 70,
+            "",
+            f"Total Calls: {summary['total_calls']}",
+            f"Total Tokens: {summary['total_tokens']:,}",
+            f"Total Cost: ${summary['total_cost']:.4f}",
+        ]
 
         if summary["by_provider"]:
-            print("\n--- BY PROVIDER ---")
-            for provider, stats in summary["by_provider"].items():
-                print(
-                    f"{provider:15} | Calls: {stats['calls']:3} | "
-                    f"Tokens: {stats['tokens']:7,} | Cost: ${stats['cost']:.4f}"
-                )
+            lines += ["", "--- BY PROVIDER ---"]
+            lines += [
+                f"{provider:15} | Calls: {stats['calls']:3} | "
+                f"Tokens: {stats['tokens']:7,} | Cost: ${stats['cost']:.4f}"
+                for provider, stats in summary["by_provider"].items()
+            ]
 
         if summary["by_agent"]:
-            print("\n--- BY AGENT ---")
-            for agent, stats in summary["by_agent"].items():
-                print(
-                    f"{agent:20} | Calls: {stats['calls']:3} | "
-                    f"Tokens: {stats['tokens']:7,} | Cost: ${stats['cost']:.4f}"
-                )
+            lines += ["", "--- BY AGENT ---"]
+            lines += [
+                f"{agent:20} | Calls: {stats['calls']:3} | "
+                f"Tokens: {stats['tokens']:7,} | Cost: ${stats['cost']:.4f}"
+                for agent, stats in summary["by_agent"].items()
+            ]
 
-        print("=" * 70 + "\n")
+        lines += ["=" * 70, ""]
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    def check_cost_limit(self) -> tuple[bool, float, float]:
+    def check_cost_limit(self, summary: Optional[dict] = None) -> tuple[bool, float, float]:
         """
         Check if total cost exceeds hard limit.
 
+        Args:
+            summary: Result of get_usage_summary() the caller already has, to
+                check against instead of refreshing the aggregates again
+
         Returns:
             (within_limit: bool, current_cost: float, limit: float)
         """
         limit = self.config.get("usage_control", {}).get("cost_tracking", {}).get("hard_limit_dollars", 100)
-        summary = self.get_usage_summary()
-        current = summary["total_cost"]
+        if summary is not None:
+            current_micro = summary["total_cost_micro"]
+        else:
+            with self._lock:
+                self._refresh_summary()
+                current_micro = self._merged_summary()["total_cost_micro"]
 
-        return (current < limit, current, limit)
+        return (current_micro < limit * MICRO, current_micro / MICRO, limit)
 
     def check_requests_per_agent_per_day(self, agent_name: str) -> tuple[bool, int, int]:
         """
@@ -188,24 +269,286 @@ class UsageTracker:
             .get("requests_per_day", 100)
         )
 
-        logs = self._load_logs()
-        today = datetime.now().date()
-        today_requests = 0
-
-        for log in logs:
-            log_date = datetime.fromisoformat(log["timestamp"]).date()
-            if log_date == today and log.get("agent") == agent_name:
-                today_requests += 1
+        today = datetime.now().date().isoformat()
+        with self._lock:
+            # Only today's partition can hold today's requests
+            state = self._refresh_day(today, self._file_for(today), closed=False)
+            today_requests = state["requests"].get(agent_name, 0)
 
         return (today_requests < limit, today_requests, limit)
 
-    def _load_logs(self) -> list:
-        """Load existing logs from file"""
-        if not self.log_file.exists():
-            return []
+    def _file_for(self, day) -> Path:
+        """Path of the log file for a YYYY-MM-DD date (string or date)"""
+        return self.log_dir / f"{self._stem}-{day}{self._suffix}"
+
+    def _rollup_for(self, day: str) -> Path:
+        """Path of the saved aggregates for a finished day's log file"""
+        return self.log_dir / f"{self._stem}-{day}.summary.json"
+
+    @staticmethod
+    def _append(path: Path, data: bytes) -> None:
+        """Append bytes to a file with O_APPEND under an exclusive lock"""
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # Every writer takes the lock: a short write could otherwise land between
+            # the chunks of a long one that the OS split
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _new_day(saved: Optional[dict] = None) -> dict:
+        """Aggregates for one day file: empty, or resumed from a saved rollup"""
+        state = {
+            "version": ROLLUP_VERSION,
+            "size": 0,
+            "total_calls": 0,
+            "by_provider": {},
+            "by_agent": {},
+            "requests": {},
+        }
+        if saved and saved.get("version") == ROLLUP_VERSION:
+            state.update(saved)
+        state["by_provider"] = defaultdict(_empty_stats, state["by_provider"])
+        state["by_agent"] = defaultdict(_empty_stats, state["by_agent"])
+        state["requests"] = defaultdict(int, state["requests"])
+        return state
+
+    def _refresh_summary(self) -> None:
+        """
+        Bring the per-day aggregates up to date with every day file in the log directory.
+
+        Days whose file was removed (e.g. archived) are dropped. Caller must hold self._lock.
+        """
+        try:
+            dir_mtime = self.log_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is None or dir_mtime != self._listing[0]:
+            prefix_len = len(self._stem) + 1
+            files = []
+            for path in self.log_dir.glob(f"{self._stem}-*{self._suffix}"):
+                day = path.name[prefix_len:-len(self._suffix)]
+                if len(day) == 10:
+                    files.append((day, path))
+            self._listing = (dir_mtime, tuple(files))
+
+        today = datetime.now().date().isoformat()
+        seen = {today}
+        # Today's file is always checked, in case it was created within the
+        # directory mtime's resolution of the last scan
+        self._refresh_day(today, self._file_for(today), closed=False)
+        for day, path in self._listing[1]:
+            if day not in seen:
+                seen.add(day)
+                self._refresh_day(day, path, closed=day < today)
+
+        for day in self._days.keys() - seen:
+            del self._days[day]
+
+    def _merged_summary(self) -> dict:
+        """
+        Totals across all days, recomputed only when some day's aggregates changed.
+
+        Caller must hold self._lock and have refreshed the aggregates.
+        """
+        key = tuple((day, state["size"]) for day, state in self._days.items())
+        if self._merged[0] == key:
+            return self._merged[1]
+
+        total_calls = 0
+        by_provider = defaultdict(_empty_stats)
+        by_agent = defaultdict(_empty_stats)
+
+        for day in self._days.values():
+            total_calls += day["total_calls"]
+            for totals, day_totals in ((by_provider, day["by_provider"]), (by_agent, day["by_agent"])):
+                for name, stats in day_totals.items():
+                    bucket = totals[name]
+                    bucket["calls"] += stats["calls"]
+                    bucket["tokens"] += stats["tokens"]
+                    bucket["cost_micro"] += stats["cost_micro"]
+
+        # Success totals are the sums of the per-provider buckets, not separate accumulators
+        total_cost_micro = sum(stats["cost_micro"] for stats in by_provider.values())
+        summary = {
+            "total_calls": total_calls,
+            "total_tokens": sum(stats["tokens"] for stats in by_provider.values()),
+            "total_cost": total_cost_micro / MICRO,
+            "total_cost_micro": total_cost_micro,
+        }
+        for field, totals in (("by_provider", by_provider), ("by_agent", by_agent)):
+            summary[field] = {
+                name: {
+                    "calls": stats["calls"],
+                    "tokens": stats["tokens"],
+                    "cost": stats["cost_micro"] / MICRO,
+                }
+                for name, stats in totals.items()
+            }
+        self._merged = (key, summary)
+        return summary
+
+    def _refresh_day(self, day: str, path: Path, closed: bool) -> dict:
+        """
+        Fold lines appended to one day file since the last refresh into its aggregates.
+
+        Reading from the last offset (rather than updating in log_batch) also picks
+        up entries written by other processes sharing the log. A finished day's
+        aggregates are saved next to its file, so later processes load them instead
+        of rescanning it - including a day that was fully folded while it was still
+        today and has not grown since. A file that shrank was replaced or truncated,
+        so its aggregates are rebuilt from scratch. Caller must hold self._lock.
 
+        Args:
+            day: YYYY-MM-DD date of the file
+            path: The day's log file
+            closed: True for days before today, whose aggregates may be saved
+
+        Returns:
+            The day's aggregates
+        """
+        state = self._days.get(day)
+        if state is None:
+            saved = self._load_rollup(day) if closed else None
+            state = self._days[day] = self._new_day(saved)
+            if saved and saved.get("version") == ROLLUP_VERSION:
+                self._rolled_up.add(day)
+
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = 0
+
+        if size < state["size"]:
+            state = self._days[day] = self._new_day()
+            self._rolled_up.discard(day)
+        if size == state["size"]:
+            if closed and day not in self._rolled_up:
+                self._save_rollup(day, state)
+                self._rolled_up.add(day)
+            return state
+
+        # Map the file rather than reading it, so only each record is copied out;
+        # a trailing partial line (a write in progress) is left for the next refresh
+        start = pos = state["size"]
         try:
-            with open(self.log_file, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return []
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                while True:
+                    nl = mm.find(b"\n", pos)
+                    if nl < 0:
+                        break
+                    line = mm[pos:nl]
+                    pos = nl + 1
+                    if not line.strip():
+                        continue
+                    try:
+                        log = _loads(line)
+                    except ValueError:
+                        continue
+                    self._fold(state, log)
+        except (OSError, ValueError):
+            pass
+        state["size"] = pos
+
+        if closed and (pos > start or day not in self._rolled_up):
+            self._save_rollup(day, state)
+            self._rolled_up.add(day)
+        return state
+
+    @staticmethod
+    def _fold(state: dict, log: dict) -> None:
+        """Add one log entry to a day's aggregates"""
+        state["total_calls"] += 1
+
+        agent = log.get("agent", "unknown")
+        state["requests"][agent] += 1
+
+        if log.get("status") != "success":
+            return
+
+        provider = log.get("provider", "unknown")
+        cost_micro = log.get("cost_micro")
+        if cost_micro is None:
+            # Entries written before cost_micro existed
+            cost_micro = round(log.get("cost_usd", 0) * MICRO)
+        tokens = log.get("total_tokens", 0)
+
+        for bucket in (state["by_provider"][provider], state["by_agent"][agent]):
+            bucket["calls"] += 1
+            bucket["tokens"] += tokens
+            bucket["cost_micro"] += cost_micro
+
+    @staticmethod
+    def _iter_entries(f) -> Iterator[dict]:
+        """Yield the entries of a JSON Lines file object one at a time, skipping bad lines"""
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield _loads(line)
+            except ValueError:
+                continue
+
+    def _load_rollup(self, day: str) -> Optional[dict]:
+        """Load a finished day's saved aggregates, or None if missing or unreadable"""
+        try:
+            return _loads(self._rollup_for(day).read_bytes())
+        except (IOError, ValueError):
+            return None
+
+    def _save_rollup(self, day: str, state: dict) -> None:
+        """Save a finished day's aggregates (atomically, as other processes may read them)"""
+        path = self._rollup_for(day)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(state))
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def _migrate_legacy_log(self) -> None:
+        """
+        Split a single-file log (JSON array or JSON Lines) into per-day files.
+
+        Handles both the configured track_file (e.g. api-usage.jsonl) and the
+        older api-usage.json next to it. The source is renamed to *.migrated
+        afterwards so it is only split once.
+        """
+        for source in (self.log_dir / f"{self._stem}{self._suffix}", self.log_dir / f"{self._stem}.json"):
+            # Claim the file first, so concurrent trackers don't split it twice
+            claimed = source.with_name(source.name + ".migrating")
+            try:
+                os.replace(source, claimed)
+                f = open(claimed, "rb")
+            except OSError:
+                continue
+
+            by_day = {}
+            with f:
+                if f.read(64).lstrip().startswith(b"["):
+                    f.seek(0)
+                    try:
+                        logs = _loads(f.read())
+                    except ValueError:
+                        logs = []
+                else:
+                    # JSON Lines: parse one entry at a time rather than the whole file at once
+                    f.seek(0)
+                    logs = self._iter_entries(f)
+
+                for log in logs:
+                    if "date" not in log:
+                        try:
+                            log["date"] = datetime.fromisoformat(log["timestamp"]).date().isoformat()
+                        except (KeyError, TypeError, ValueError):
+                            continue
+                    by_day.setdefault(log["date"], []).append(_dump_line(log))
+
+            for day, lines in by_day.items():
+                self._append(self._file_for(day), b"".join(lines))
+            os.replace(claimed, source.with_name(source.name + ".migrated"))